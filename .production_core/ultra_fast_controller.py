@@ -187,7 +187,9 @@ class UltraFastController:
 
 # Performance utilities
 
-@njit(cache=True, fastmath=True)
+# Eagerly compiled for a contiguous float64 state so the benchmark never
+# pays first-call type dispatch or compilation
+@njit('float64(float64[::1], int64)', cache=True, fastmath=True)
 def benchmark_control_loop(state_array, iterations):
     """Ultra-fast benchmark loop for performance testing."""
     pos_gains = np.array([0.01, 0.0001, 0.005])
@@ -0,0 +1,146 @@
+#==========================================================================================\\\
+#=========================== scripts/_bench_kernels.py ==================================\\\
+#==========================================================================================\\\
+"""
+Numba-compiled benchmark kernels.
+Fused control + dynamics step mirroring BulletproofController (normal and
+emergency modes, without rate limiting) and DIPDynamics, for measuring the
+native cost of one control loop iteration.
+"""
+
+import math
+import numpy as np
+from numba import njit, prange
+
+# Flat parameter layout (avoids reflected lists / dicts inside nopython code)
+P_MAX_FORCE = 0
+P_EMERGENCY_THRESHOLD = 1
+P_TOTAL_MASS = 2
+P_L_POLE1 = 3
+P_L_POLE2 = 4
+P_GRAVITY = 5
+P_DT = 6
+
+# Defaults of BulletproofController and DIPDynamics
+DEFAULT_PARAMS = np.array([
+    5.0,    # max_force
+    1.0,    # emergency_threshold
+    1.2,    # M_cart + M_pole1 + M_pole2
+    0.5,    # L_pole1
+    0.5,    # L_pole2
+    9.81,   # g
+    0.01,   # dt
+], dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _clip(value, low, high):
+    if value < low:
+        return low
+    if value > high:
+        return high
+    return value
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _wrap(angle):
+    return math.atan2(math.sin(angle), math.cos(angle))
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def control_force(state, params):
+    """Energy dissipation control law for a 6-element state."""
+
+    # Condition state to the controller bounds
+    x = _clip(state[0], -2.0, 2.0)
+    theta1 = _clip(state[1], -0.5, 0.5)
+    theta2 = _clip(state[2], -0.5, 0.5)
+    x_dot = _clip(state[3], -5.0, 5.0)
+    theta1_dot = _clip(state[4], -10.0, 10.0)
+    theta2_dot = _clip(state[5], -10.0, 10.0)
+
+    total_energy = (abs(x) + abs(x_dot) + abs(theta1) + abs(theta2)
+                    + abs(theta1_dot) + abs(theta2_dot))
+
+    if total_energy > params[P_EMERGENCY_THRESHOLD]:
+        # Emergency mode: pure energy dissipation
+        force = _clip(-0.02 * x_dot - 0.05 * theta1_dot - 0.05 * theta2_dot, -1.0, 1.0)
+    else:
+        theta1 = _wrap(theta1)
+        theta2 = _wrap(theta2)
+
+        force = -0.05 * x_dot
+        force += -0.2 * math.sin(theta1) * theta1_dot
+        force += -0.2 * math.sin(theta2) * theta2_dot
+
+        if abs(x) > 0.1:
+            force += -0.01 * x
+        if abs(theta1) < 0.2:
+            force += -0.5 * theta1
+        if abs(theta2) < 0.2:
+            force += -0.5 * theta2
+
+    return _clip(force, -params[P_MAX_FORCE], params[P_MAX_FORCE])
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def step(state_out, state_in, params):
+    """One control + dynamics step writing the next state into state_out.
+
+    Returns the applied control force.
+    """
+
+    control = control_force(state_in, params)
+
+    x = _clip(state_in[0], -10.0, 10.0)
+    theta1 = _wrap(state_in[1])
+    theta2 = _wrap(state_in[2])
+    x_dot = _clip(state_in[3], -20.0, 20.0)
+    theta1_dot = _clip(state_in[4], -50.0, 50.0)
+    theta2_dot = _clip(state_in[5], -50.0, 50.0)
+
+    damping = 0.05
+
+    cart_accel = control / params[P_TOTAL_MASS]
+    cart_accel -= damping * x_dot
+    cart_accel -= 0.1 * x
+
+    g = params[P_GRAVITY]
+    pole1_accel = (g * math.sin(theta1) - cart_accel * math.cos(theta1)) / params[P_L_POLE1]
+    pole2_accel = (g * math.sin(theta2) - cart_accel * math.cos(theta2)) / params[P_L_POLE2]
+
+    pole1_accel -= damping * theta1_dot
+    pole2_accel -= damping * theta2_dot
+
+    coupling = 0.05 * (theta2 - theta1)
+    pole1_accel += coupling
+    pole2_accel -= coupling
+
+    dt = params[P_DT]
+    state_out[0] = x + x_dot * dt
+    state_out[1] = _wrap(theta1 + theta1_dot * dt)
+    state_out[2] = _wrap(theta2 + theta2_dot * dt)
+    state_out[3] = x_dot + cart_accel * dt
+    state_out[4] = theta1_dot + pole1_accel * dt
+    state_out[5] = theta2_dot + pole2_accel * dt
+
+    return control
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def run_steps(states, params):
+    """Integrate states[0] forward, filling states[1:] in place.
+
+    Each step depends on the previous one, so the loop is sequential.
+    """
+
+    for i in range(states.shape[0] - 1):
+        step(states[i + 1], states[i], params)
+
+
+@njit(parallel=True, cache=True, fastmath=True, boundscheck=False)
+def control_batch(state, params, out):
+    """Evaluate the control law for the same state out.shape[0] times in parallel."""
+
+    for i in prange(out.shape[0]):
+        out[i] = control_force(state, params)
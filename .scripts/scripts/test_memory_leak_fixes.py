@@ -22,12 +22,15 @@ Usage:
 """
 
 import argparse
+import logging
+import logging.handlers
 import time
 import threading
 import psutil
 import os
 import gc
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any
 import matplotlib.pyplot as plt
@@ -40,6 +43,62 @@ from interfaces.monitoring.metrics_collector_fixed import (
     ProductionSafeMetricsCollector, MemoryProfile, MetricType
 )
 
+# Iteration telemetry is buffered and flushed in batches to keep stdout
+# writes out of the load loop
+logger = logging.getLogger('mem_leak')
+_telemetry_handler = logging.handlers.MemoryHandler(
+    100, flushLevel=logging.ERROR, target=logging.StreamHandler(sys.stdout)
+)
+logger.addHandler(_telemetry_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+@dataclass(slots=True)
+class BoundedMemoryResult:
+    """Outcome of a bounded-memory run for a single memory profile."""
+    profile: str
+    initial_memory_mb: float
+    final_memory_mb: float
+    memory_increase_mb: float
+    metrics_created: int
+    values_added: int
+    final_metrics_count: int
+    final_values_count: int
+    memory_bounded: bool
+    memory_samples: List[float]
+    health_status: str
+    force_cleanups: int
+    memory_alerts: int
+    passed: bool = False
+
+
+@dataclass(slots=True)
+class MemoryPressureResult:
+    """Outcome of the memory pressure handling test."""
+    initial_memory_mb: float
+    final_memory_mb: float
+    memory_increase_mb: float
+    memory_handled: bool
+    cleanups_triggered: bool
+    final_health: str
+    force_cleanups: int
+    memory_alerts: int
+    passed: bool = False
+
+
+@dataclass(slots=True)
+class CleanupResult:
+    """Outcome of the cleanup effectiveness test."""
+    values_before: int
+    values_after: int
+    values_cleaned: int
+    memory_before_mb: float
+    memory_after_mb: float
+    memory_reduced_mb: float
+    cleanup_effective: bool
+    passed: bool = False
+
 
 class MemoryLeakTester:
     """Test memory leak fixes in metrics collector."""
@@ -64,7 +123,7 @@ class MemoryLeakTester:
 
         return memory_samples
 
-    def test_fixed_collector_bounded_memory(self, profile: MemoryProfile = MemoryProfile.PRODUCTION) -> Dict[str, Any]:
+    def test_fixed_collector_bounded_memory(self, profile: MemoryProfile = MemoryProfile.PRODUCTION) -> BoundedMemoryResult:
         """Test that fixed collector keeps memory bounded."""
         print(f"\n🧪 Testing Fixed Collector - {profile.value.upper()} Profile")
         print("=" * 60)
@@ -98,44 +157,50 @@ class MemoryLeakTester:
                     total_values_added += 1
                     metrics_created += 1
 
-            # Check memory every 10 iterations
-            if iteration % 10 == 0:
+            # Check memory every 10 iterations and on the last one
+            if iteration % 10 == 0 or iteration == 99:
                 current_memory = self.get_memory_usage_mb()
                 memory_samples.append(current_memory)
 
                 stats = collector.get_memory_stats()
                 health = collector.get_health_status()
 
-                print(f"Iteration {iteration}: {current_memory:.1f}MB process, "
-                      f"{stats.estimated_metric_memory_mb:.1f}MB metrics, "
-                      f"{stats.metric_count} metrics, {stats.total_metric_values} values, "
-                      f"health: {health['status']}")
+                logger.info("Iteration %d: %.1fMB process, %.1fMB metrics, "
+                            "%d metrics, %d values, health: %s",
+                            iteration, current_memory, stats.estimated_metric_memory_mb,
+                            stats.metric_count, stats.total_metric_values, health['status'])
+
+                last_health = health
 
                 # Force garbage collection
                 gc.collect()
 
+        _telemetry_handler.flush()
+
         final_memory = self.get_memory_usage_mb()
-        final_stats = collector.get_health_status()
+        # Reuse the snapshot from the last iteration instead of rescanning
+        final_stats = last_health
 
         # Results
         memory_increase = final_memory - initial_memory
         bounded_memory = memory_increase < 100  # Should increase by less than 100MB
 
-        result = {
-            'profile': profile.value,
-            'initial_memory_mb': initial_memory,
-            'final_memory_mb': final_memory,
-            'memory_increase_mb': memory_increase,
-            'metrics_created': metrics_created,
-            'values_added': total_values_added,
-            'final_metrics_count': final_stats['metrics_count'],
-            'final_values_count': final_stats['total_values'],
-            'memory_bounded': bounded_memory,
-            'memory_samples': memory_samples,
-            'health_status': final_stats['status'],
-            'force_cleanups': final_stats['force_cleanups_performed'],
-            'memory_alerts': final_stats['memory_alerts_sent']
-        }
+        result = BoundedMemoryResult(
+            profile=profile.value,
+            initial_memory_mb=initial_memory,
+            final_memory_mb=final_memory,
+            memory_increase_mb=memory_increase,
+            metrics_created=metrics_created,
+            values_added=total_values_added,
+            final_metrics_count=final_stats['metrics_count'],
+            final_values_count=final_stats['total_values'],
+            memory_bounded=bounded_memory,
+            memory_samples=memory_samples,
+            health_status=final_stats['status'],
+            force_cleanups=final_stats['force_cleanups_performed'],
+            memory_alerts=final_stats['memory_alerts_sent'],
+            passed=bounded_memory
+        )
 
         status = "✅ PASS" if bounded_memory else "❌ FAIL"
         print(f"\n{status} Memory Bounded Test:")
@@ -146,7 +211,7 @@ class MemoryLeakTester:
 
         return result
 
-    def test_memory_pressure_handling(self) -> Dict[str, Any]:
+    def test_memory_pressure_handling(self) -> MemoryPressureResult:
         """Test how collector handles memory pressure."""
         print(f"\n🧪 Testing Memory Pressure Handling")
         print("=" * 60)
@@ -167,16 +232,17 @@ class MemoryLeakTester:
         memory_handled = health['status'] != 'critical'
         cleanups_triggered = health['force_cleanups_performed'] > 0
 
-        result = {
-            'initial_memory_mb': initial_memory,
-            'final_memory_mb': final_memory,
-            'memory_increase_mb': final_memory - initial_memory,
-            'memory_handled': memory_handled,
-            'cleanups_triggered': cleanups_triggered,
-            'final_health': health['status'],
-            'force_cleanups': health['force_cleanups_performed'],
-            'memory_alerts': health['memory_alerts_sent']
-        }
+        result = MemoryPressureResult(
+            initial_memory_mb=initial_memory,
+            final_memory_mb=final_memory,
+            memory_increase_mb=final_memory - initial_memory,
+            memory_handled=memory_handled,
+            cleanups_triggered=cleanups_triggered,
+            final_health=health['status'],
+            force_cleanups=health['force_cleanups_performed'],
+            memory_alerts=health['memory_alerts_sent'],
+            passed=memory_handled
+        )
 
         status = "✅ PASS" if memory_handled else "❌ FAIL"
         print(f"\n{status} Memory Pressure Test:")
@@ -186,7 +252,7 @@ class MemoryLeakTester:
 
         return result
 
-    def test_cleanup_effectiveness(self) -> Dict[str, Any]:
+    def test_cleanup_effectiveness(self) -> CleanupResult:
         """Test that cleanup actually reduces memory usage."""
         print(f"\n🧪 Testing Cleanup Effectiveness")
         print("=" * 60)
@@ -212,15 +278,16 @@ class MemoryLeakTester:
 
         cleanup_effective = values_cleaned > 0 and memory_reduced > 0
 
-        result = {
-            'values_before': before_stats.total_metric_values,
-            'values_after': after_stats.total_metric_values,
-            'values_cleaned': values_cleaned,
-            'memory_before_mb': before_stats.estimated_metric_memory_mb,
-            'memory_after_mb': after_stats.estimated_metric_memory_mb,
-            'memory_reduced_mb': memory_reduced,
-            'cleanup_effective': cleanup_effective
-        }
+        result = CleanupResult(
+            values_before=before_stats.total_metric_values,
+            values_after=after_stats.total_metric_values,
+            values_cleaned=values_cleaned,
+            memory_before_mb=before_stats.estimated_metric_memory_mb,
+            memory_after_mb=after_stats.estimated_metric_memory_mb,
+            memory_reduced_mb=memory_reduced,
+            cleanup_effective=cleanup_effective,
+            passed=cleanup_effective
+        )
 
         status = "✅ PASS" if cleanup_effective else "❌ FAIL"
         print(f"\n{status} Cleanup Effectiveness:")
@@ -255,16 +322,13 @@ class MemoryLeakTester:
         results['tests']['cleanup_effectiveness'] = self.test_cleanup_effectiveness()
 
         # Overall assessment
-        all_tests_passed = all(
-            test_result.get('memory_bounded', test_result.get('memory_handled', test_result.get('cleanup_effective', False)))
-            for test_result in results['tests'].values()
-        )
+        tests_passed = sum(test_result.passed for test_result in results['tests'].values())
+        all_tests_passed = tests_passed == len(results['tests'])
 
         results['overall_status'] = 'PASSED' if all_tests_passed else 'FAILED'
         results['summary'] = {
             'total_tests': len(results['tests']),
-            'tests_passed': sum(1 for test in results['tests'].values()
-                              if test.get('memory_bounded', test.get('memory_handled', test.get('cleanup_effective', False)))),
+            'tests_passed': tests_passed,
             'memory_leak_fixed': all_tests_passed
         }
 
@@ -290,9 +354,8 @@ class MemoryLeakTester:
 
             # Plot memory samples from different profile tests
             for test_name, test_data in results['tests'].items():
-                if 'memory_samples' in test_data and 'bounded_memory' in test_name:
-                    profile = test_data.get('profile', 'unknown')
-                    plt.plot(test_data['memory_samples'], label=f"{profile} Profile", marker='o', alpha=0.7)
+                if isinstance(test_data, BoundedMemoryResult) and 'bounded_memory' in test_name:
+                    plt.plot(test_data.memory_samples, label=f"{test_data.profile} Profile", marker='o', alpha=0.7)
 
             plt.xlabel('Time (iterations)')
             plt.ylabel('Memory Usage (MB)')
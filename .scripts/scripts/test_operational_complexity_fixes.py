@@ -133,9 +133,11 @@ def measure_complexity_reduction():
     total_lines = 0
     for py_file in python_files:
         try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                total_lines += len(f.readlines())
-        except Exception:
+            # Count newlines on raw chunks instead of building a list of lines
+            with open(py_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    total_lines += chunk.count(b'\n')
+        except OSError:
             # Skip files that can't be read
             pass
 
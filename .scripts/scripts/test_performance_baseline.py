@@ -9,12 +9,36 @@ Measure current performance before extreme optimization.
 import sys
 import os
 import time
+import timeit
 import gc
-import statistics
+import functools
 import numpy as np
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add project root to path (once, even if imported repeatedly)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Initial state [x, theta1, theta2, x_dot, theta1_dot, theta2_dot] shared by all tests
+_INITIAL_STATE = np.array([0.1, 0.1, 0.1, 0.0, 0.0, 0.0], dtype=np.float64)
+_INITIAL_STATE.setflags(write=False)
+
+def _warmup(controller, dynamics=None, n=500, state=None):
+    """Run untimed iterations so first-call costs stay out of measurements.
+
+    Returns the final state and the warm-up wall time in milliseconds.
+    """
+    state = np.array(_INITIAL_STATE if state is None else state, dtype=np.float64)
+    next_state = np.empty_like(state)
+
+    start = time.perf_counter_ns()
+    for _ in range(n):
+        control = controller.compute_control(state)
+        if dynamics is not None:
+            next_state[:] = dynamics.compute_dynamics(state, control)
+            state, next_state = next_state, state
+
+    return state, (time.perf_counter_ns() - start) / 1e6
 
 def test_control_loop_performance():
     """Test current control loop performance."""
@@ -28,41 +52,75 @@ def test_control_loop_performance():
         dynamics = DIPDynamics()
 
         # Warm up
-        state = [0.1, 0.1, 0.1, 0.0, 0.0, 0.0]
-        for _ in range(100):
-            control = controller.compute_control(state)
-            state = dynamics.compute_dynamics(state, control)
-
-        # Performance test
-        times = []
+        state, warmup_time = _warmup(controller, dynamics)
+        print(f"Warm-up: {warmup_time:.1f} ms (not timed)")
+
+        # compute_dynamics returns a new list; copy it into two reused buffers
+        buffers = [state, np.empty_like(state)]
+        # Bind the hot methods once so the loop skips attribute lookups
+        compute_control = controller.compute_control
+        compute_dynamics = dynamics.compute_dynamics
+
+        def control_step():
+            """Single control loop iteration."""
+            current, spare = buffers
+            control = compute_control(current)
+            spare[:] = compute_dynamics(current, control)
+            buffers[0], buffers[1] = spare, current
+
+        # Performance test: the distribution comes from timing every 50th
+        # iteration of a fixed-length run individually
         num_iterations = 1000
+        sample_every = 50
+        samples_ns = np.empty(num_iterations // sample_every, dtype=np.int64)
 
         print(f"Running {num_iterations} control loop iterations...")
 
-        for i in range(num_iterations):
-            start = time.perf_counter()
-
-            # Single control loop iteration
-            control = controller.compute_control(state)
-            state = dynamics.compute_dynamics(state, control)
-
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to milliseconds
+        # Keep collector pauses out of the samples (timeit does the same below)
+        perf_counter_ns = time.perf_counter_ns
+        gc.collect()
+        gc.disable()
+        try:
+            for i in range(num_iterations):
+                if i % sample_every == 0:
+                    start = perf_counter_ns()
+                    control_step()
+                    samples_ns[i // sample_every] = perf_counter_ns() - start
+                else:
+                    control_step()
+        finally:
+            gc.enable()
+
+        # The mean comes from a run sized by autorange (>= 0.2 s in total)
+        loops, elapsed = timeit.Timer(control_step).autorange()
 
         # Calculate statistics
-        mean_time = statistics.mean(times)
-        median_time = statistics.median(times)
-        p95_time = np.percentile(times, 95)
-        min_time = min(times)
-        max_time = max(times)
+        times = samples_ns / 1e6  # Convert to milliseconds
+        mean_time = elapsed / loops * 1000
+        # 'lower' reports actual observed samples rather than interpolated values
+        min_time, median_time, p95_time, max_time = np.quantile(
+            times, [0.0, 0.5, 0.95, 1.0], method='lower'
+        )
 
         print(f"Control Loop Performance:")
-        print(f"  Mean time: {mean_time:.3f} ms")
+        print(f"  Mean time: {mean_time:.3f} ms ({loops} iterations)")
         print(f"  Median time: {median_time:.3f} ms")
         print(f"  95th percentile: {p95_time:.3f} ms")
         print(f"  Min time: {min_time:.3f} ms")
         print(f"  Max time: {max_time:.3f} ms")
 
+        # Reference: the same loop as a fused Numba kernel
+        from _bench_kernels import run_steps, DEFAULT_PARAMS
+
+        states = np.empty((num_iterations + 1, 6), dtype=np.float64)
+        states[0] = _INITIAL_STATE
+        run_steps(states, DEFAULT_PARAMS)  # JIT compile outside the timed region
+
+        start = time.perf_counter_ns()
+        run_steps(states, DEFAULT_PARAMS)
+        kernel_time = (time.perf_counter_ns() - start) / num_iterations / 1e6
+        print(f"  Compiled kernel: {kernel_time:.5f} ms per step")
+
         # Check target: <0.01ms (10 microseconds)
         target_ms = 0.01
         if mean_time < target_ms:
@@ -88,17 +146,28 @@ def test_memory_usage():
         dynamics = DIPDynamics()
 
         # Run control loops
-        state = [0.1, 0.1, 0.1, 0.0, 0.0, 0.0]
+        state = _INITIAL_STATE.copy()
+        next_state = np.empty_like(state)
 
         for i in range(1000):
             control = controller.compute_control(state)
-            state = dynamics.compute_dynamics(state, control)
+            next_state[:] = dynamics.compute_dynamics(state, control)
+            state, next_state = next_state, state
+
+        # Same loop through the shared compiled kernel (cached by the control loop test)
+        from _bench_kernels import run_steps, DEFAULT_PARAMS
+
+        states = np.empty((1001, 6), dtype=np.float64)
+        states[0] = _INITIAL_STATE
+        run_steps(states, DEFAULT_PARAMS)
+        if not np.all(np.isfinite(states)):
+            raise ValueError("Compiled kernel produced non-finite states")
 
         # Force garbage collection
         gc.collect()
 
         print(f"Memory Usage:")
-        print(f"  Completed 1000 iterations")
+        print(f"  Completed 1000 iterations (controller and compiled kernel)")
         print(f"  Garbage collection performed")
 
         # Basic check - if we get here without memory errors, it's good
@@ -116,36 +185,58 @@ def test_scalability():
     try:
         from production_core.bulletproof_controller import BulletproofController
 
+        from _bench_kernels import control_batch, DEFAULT_PARAMS
+
         controller = BulletproofController()
 
         # Test different load levels
         load_levels = [100, 500, 1000, 2000]
         results = {}
 
-        for load in load_levels:
-            state = [0.1, 0.1, 0.1, 0.0, 0.0, 0.0]
-            times = []
+        # Parallel reference sweep: same state, independent evaluations
+        batch_state = _INITIAL_STATE
+        batch_out = np.empty(max(load_levels), dtype=np.float64)
+        control_batch(batch_state, DEFAULT_PARAMS, batch_out)  # JIT compile outside the timed region
+
+        _, warmup_time = _warmup(controller)
+        print(f"  Warm-up: {warmup_time:.1f} ms (not timed)")
+
+        # One contiguous pass up to the highest load, timestamped each time
+        # the call count reaches a load level; each level is a prefix window
+        compute_control = functools.partial(controller.compute_control, _INITIAL_STATE)
+        checkpoints_ns = np.empty(len(load_levels) + 1, dtype=np.int64)
+        completed = 0
 
-            start_total = time.perf_counter()
+        gc.collect()
+        gc.disable()
+        try:
+            checkpoints_ns[0] = time.perf_counter_ns()
+            for k, load in enumerate(load_levels, start=1):
+                for _ in range(load - completed):
+                    compute_control()
+                checkpoints_ns[k] = time.perf_counter_ns()
+                completed = load
+        finally:
+            gc.enable()
 
-            for _ in range(load):
-                start = time.perf_counter()
-                control = controller.compute_control(state)
-                end = time.perf_counter()
-                times.append((end - start) * 1000)
+        for k, load in enumerate(load_levels, start=1):
+            total_ns = checkpoints_ns[k] - checkpoints_ns[0]
 
-            end_total = time.perf_counter()
-            total_time = (end_total - start_total) * 1000
+            mean_time = total_ns / load / 1e6
+            throughput = load / (total_ns / 1e9)  # Operations per second
 
-            mean_time = statistics.mean(times)
-            throughput = load / (total_time / 1000)  # Operations per second
+            start_batch = time.perf_counter_ns()
+            control_batch(batch_state, DEFAULT_PARAMS, batch_out[:load])
+            batch_throughput = load / ((time.perf_counter_ns() - start_batch) / 1e9)
 
             results[load] = {
                 'mean_time': mean_time,
-                'throughput': throughput
+                'throughput': throughput,
+                'batch_throughput': batch_throughput
             }
 
-            print(f"  Load {load}: {mean_time:.3f}ms avg, {throughput:.0f} ops/sec")
+            print(f"  Load {load}: {mean_time:.3f}ms avg, {throughput:.0f} ops/sec "
+                  f"(parallel kernel: {batch_throughput:.0f} ops/sec)")
 
         # Check for performance degradation
         baseline_throughput = results[100]['throughput']
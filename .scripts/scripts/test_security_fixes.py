@@ -11,11 +11,22 @@ import os
 import time
 import threading
 import secrets
+import importlib.util
 from datetime import datetime, timezone
 import logging
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add project root to path (once, even if imported repeatedly)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from security.authentication import auth_manager, AuthenticationManager, UserRole, Permission
+from security.input_validation import input_validator, InputType, ValidationError
+from security.secure_communications import SecureTLSServer, SecureMessage, MessageType
+from security.audit_logging import (
+    audit_logger, AuditEvent, AuditEventType, AuditSeverity,
+    log_login_success, log_control_command, log_security_violation
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -26,8 +37,6 @@ def test_authentication_system():
     logger.info("Testing Authentication & Authorization System...")
 
     try:
-        from security.authentication import auth_manager, UserRole, Permission
-
         # Test user creation
         success = auth_manager.create_user("test_user", "SecurePass123!", UserRole.OPERATOR)
         if not success:
@@ -57,16 +66,43 @@ def test_authentication_system():
         return True, "Authentication system validated"
 
     except Exception as e:
-        logger.error(f"Authentication test failed: {e}")
+        logger.error("Authentication test failed: %s", e)
         return False, f"Authentication test error: {e}"
 
+def test_logout_after_session_eviction():
+    """Logging out must revoke a token even after its session was evicted"""
+    logger.info("Testing Logout of Evicted Sessions...")
+
+    try:
+        # One cached session: the second login evicts the first
+        manager = AuthenticationManager(max_sessions=1)
+        manager.create_user("evict_user", "SecurePass123!", UserRole.OPERATOR)
+        token = manager.authenticate("evict_user", "SecurePass123!")
+        other_token = manager.authenticate("admin", "DIP_Admin_2025!")
+        if not token or not other_token:
+            return False, "Authentication failed"
+        if token in manager.sessions:
+            return False, "Session was not evicted"
+
+        if not manager.logout(token):
+            return False, "Logout of evicted session failed"
+        if manager.validate_token(token):
+            return False, "Logged-out token accepted after eviction"
+        if not manager.validate_token(other_token):
+            return False, "Unrelated session was invalidated"
+
+        logger.info("✓ Evicted sessions are revoked on logout")
+        return True, "Logout after eviction validated"
+
+    except Exception as e:
+        logger.error("Logout eviction test failed: %s", e)
+        return False, f"Logout eviction test error: {e}"
+
 def test_input_validation():
     """Test input validation and sanitization"""
     logger.info("Testing Input Validation & Sanitization...")
 
     try:
-        from security.input_validation import input_validator, InputType, ValidationError
-
         # Test valid control force
         valid_force = input_validator.validate_numeric_input(50.0, InputType.CONTROL_FORCE)
         if abs(valid_force - 50.0) > 0.001:
@@ -101,22 +137,57 @@ def test_input_validation():
         return True, "Input validation system validated"
 
     except Exception as e:
-        logger.error(f"Input validation test failed: {e}")
+        logger.error("Input validation test failed: %s", e)
         return False, f"Input validation test error: {e}"
 
+def test_input_validation_without_numba():
+    """Input validation must work on installs without numba"""
+    logger.info("Testing Input Validation Without Numba...")
+
+    import security.input_validation as validation_module
+    saved_numba = sys.modules.get('numba')
+    # A None entry makes "from numba import njit" raise ImportError
+    sys.modules['numba'] = None
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "_input_validation_no_numba", validation_module.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        validator = module.InputValidator()
+        value = validator.validate_numeric_input(50.0, module.InputType.CONTROL_FORCE)
+        if abs(value - 50.0) > 0.001:
+            return False, "Valid input rejected without numba"
+
+        try:
+            validator.validate_numeric_input(200.0, module.InputType.CONTROL_FORCE)
+            return False, "Out-of-bounds input accepted without numba"
+        except module.ValidationError:
+            pass  # Expected
+
+        logger.info("✓ Input validation working without numba")
+        return True, "Pure-Python fallback validated"
+
+    except Exception as e:
+        logger.error("No-numba validation test failed: %s", e)
+        return False, f"No-numba validation test error: {e}"
+    finally:
+        if saved_numba is None:
+            sys.modules.pop('numba', None)
+        else:
+            sys.modules['numba'] = saved_numba
+
 def test_secure_communications():
     """Test secure communications system"""
     logger.info("Testing Secure Communications...")
 
     try:
-        from security.secure_communications import SecureTLSServer, SecureTLSClient, SecureMessage, MessageType
-
         # Test message encryption/decryption
         server = SecureTLSServer()
 
         message = SecureMessage(
             message_id=secrets.token_hex(16),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=time.time_ns(),
             message_type=MessageType.CONTROL_COMMAND,
             payload={'control_force': 10.0},
             sender_id="test_client"
@@ -144,7 +215,7 @@ def test_secure_communications():
         return True, "Secure communications validated"
 
     except Exception as e:
-        logger.error(f"Secure communications test failed: {e}")
+        logger.error("Secure communications test failed: %s", e)
         return False, f"Secure communications test error: {e}"
 
 def test_audit_logging():
@@ -152,9 +223,6 @@ def test_audit_logging():
     logger.info("Testing Audit Logging System...")
 
     try:
-        from security.audit_logging import audit_logger, AuditEvent, AuditEventType, AuditSeverity
-        from security.audit_logging import log_login_success, log_control_command, log_security_violation
-
         # Test audit event logging
         event = AuditEvent(
             event_id="",
@@ -194,7 +262,7 @@ def test_audit_logging():
         return True, "Audit logging system validated"
 
     except Exception as e:
-        logger.error(f"Audit logging test failed: {e}")
+        logger.error("Audit logging test failed: %s", e)
         return False, f"Audit logging test error: {e}"
 
 def test_integrated_security_workflow():
@@ -202,10 +270,6 @@ def test_integrated_security_workflow():
     logger.info("Testing Integrated Security Workflow...")
 
     try:
-        from security.authentication import auth_manager, UserRole, Permission
-        from security.input_validation import input_validator, InputType
-        from security.audit_logging import log_control_command
-
         # Simulate secure control command workflow
 
         # 1. Authentication
@@ -230,7 +294,7 @@ def test_integrated_security_workflow():
         return True, "Integrated security workflow validated"
 
     except Exception as e:
-        logger.error(f"Integrated security test failed: {e}")
+        logger.error("Integrated security test failed: %s", e)
         return False, f"Integrated security test error: {e}"
 
 def test_security_attack_scenarios():
@@ -238,17 +302,16 @@ def test_security_attack_scenarios():
     logger.info("Testing Security Against Attack Scenarios...")
 
     try:
-        from security.authentication import auth_manager
-        from security.input_validation import input_validator, InputType, ValidationError
-
-        # Test brute force protection
-        for i in range(6):  # Should lock after 5 attempts
-            token = auth_manager.authenticate("admin", "wrong_password")
-            if token:
-                return False, "Brute force protection failed"
+        # Test brute force protection: every failure locks the account with a
+        # growing back-off, so one real wrong-password login (full password
+        # check) is enough to trigger it
+        auth_manager.create_user("brute_force_target", "SecurePass123!", UserRole.MONITOR)
+        token = auth_manager.authenticate("brute_force_target", "wrong_password")
+        if token:
+            return False, "Brute force protection failed"
 
-        # Account should now be locked
-        token = auth_manager.authenticate("admin", "DIP_Admin_2025!")
+        # Account should now be locked: even the correct password is rejected
+        token = auth_manager.authenticate("brute_force_target", "SecurePass123!")
         if token:
             return False, "Account locking failed"
 
@@ -280,7 +343,7 @@ def test_security_attack_scenarios():
         return True, "Security attack scenarios validated"
 
     except Exception as e:
-        logger.error(f"Security attack test failed: {e}")
+        logger.error("Security attack test failed: %s", e)
         return False, f"Security attack test error: {e}"
 
 def run_comprehensive_security_test():
@@ -292,7 +355,9 @@ def run_comprehensive_security_test():
     # Run all security tests
     tests = [
         ("Authentication System", test_authentication_system),
+        ("Logout After Eviction", test_logout_after_session_eviction),
         ("Input Validation", test_input_validation),
+        ("Input Validation Without Numba", test_input_validation_without_numba),
         ("Secure Communications", test_secure_communications),
         ("Audit Logging", test_audit_logging),
         ("Integrated Workflow", test_integrated_security_workflow),
@@ -303,18 +368,18 @@ def run_comprehensive_security_test():
     total_tests = len(tests)
 
     for test_name, test_func in tests:
-        logger.info(f"\nTesting {test_name}...")
+        logger.info("\nTesting %s...", test_name)
         try:
             success, message = test_func()
             test_results[test_name] = {'passed': success, 'message': message}
             if success:
                 passed_tests += 1
-                logger.info(f"✓ {test_name}: PASSED")
+                logger.info("✓ %s: PASSED", test_name)
             else:
-                logger.error(f"✗ {test_name}: FAILED - {message}")
+                logger.error("✗ %s: FAILED - %s", test_name, message)
         except Exception as e:
             test_results[test_name] = {'passed': False, 'message': f"Test error: {e}"}
-            logger.error(f"✗ {test_name}: ERROR - {e}")
+            logger.error("✗ %s: ERROR - %s", test_name, e)
 
     # Generate summary
     success_rate = (passed_tests / total_tests) * 100
@@ -322,7 +387,7 @@ def run_comprehensive_security_test():
     logger.info("\n" + "="*70)
     logger.info("SECURITY VALIDATION SUMMARY")
     logger.info("="*70)
-    logger.info(f"Tests Passed: {passed_tests}/{total_tests} ({success_rate:.1f}%)")
+    logger.info("Tests Passed: %s/%s (%.1f%%)", passed_tests, total_tests, success_rate)
 
     if success_rate >= 90:
         security_status = "EXCELLENT"
@@ -337,14 +402,14 @@ def run_comprehensive_security_test():
         security_status = "POOR"
         new_security_score = 2.0
 
-    logger.info(f"Security Status: {security_status}")
-    logger.info(f"New Security Score: {new_security_score}/10")
+    logger.info("Security Status: %s", security_status)
+    logger.info("New Security Score: %s/10", new_security_score)
 
     # Calculate improvement
     original_score = 2.7
     improvement = new_security_score - original_score
 
-    logger.info(f"Security Improvement: +{improvement:.1f} points ({improvement/10*100:.1f}% better)")
+    logger.info("Security Improvement: +%.1f points (%.1f%% better)", improvement, improvement/10*100)
 
     if success_rate >= 90:
         logger.info("🛡️ SECURITY READY FOR PRODUCTION!")
@@ -368,7 +433,7 @@ def main():
         return results['success_rate'] >= 90
 
     except Exception as e:
-        logger.error(f"Security validation failed: {e}")
+        logger.error("Security validation failed: %s", e)
         return False
 
 if __name__ == "__main__":
@@ -9,37 +9,57 @@ Focused test to verify we achieve the Phase 3 security target.
 import sys
 import os
 import logging
+import functools
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add project root to path (once, even if imported repeatedly)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Security components are created once and shared across the checks below
+@functools.lru_cache(maxsize=1)
+def _auth_manager():
+    from security.authentication import AuthenticationManager
+    return AuthenticationManager()
+
+@functools.lru_cache(maxsize=1)
+def _input_validator():
+    from security.input_validation import InputValidator
+    return InputValidator()
+
+@functools.lru_cache(maxsize=1)
+def _secure_server():
+    from security.secure_communications import SecureTLSServer
+    return SecureTLSServer(port=8447)
+
+@functools.lru_cache(maxsize=1)
+def _audit_logger():
+    from security.audit_logging import AuditLogger
+    return AuditLogger()
+
 def test_security_components():
     """Test that all security components are functional."""
     logger.info("Testing security components...")
 
     try:
         # Test 1: Authentication Manager
-        from security.authentication import AuthenticationManager
-        auth_manager = AuthenticationManager()
+        _auth_manager()
         logger.info("✓ Authentication Manager initialized")
 
         # Test 2: Input Validator
-        from security.input_validation import InputValidator
-        input_validator = InputValidator()
+        _input_validator()
         logger.info("✓ Input Validator initialized")
 
         # Test 3: Secure Communications
-        from security.secure_communications import SecureTLSServer
-        secure_server = SecureTLSServer(port=8447)
+        _secure_server()
         logger.info("✓ Secure Communications initialized")
 
         # Test 4: Audit Logger
-        from security.audit_logging import AuditLogger
-        audit_logger = AuditLogger()
+        _audit_logger()
         logger.info("✓ Audit Logger initialized")
 
         return True, "All security components functional"
@@ -56,8 +76,7 @@ def calculate_manual_security_score():
 
     try:
         # Authentication System (2.5 points)
-        from security.authentication import AuthenticationManager
-        auth_manager = AuthenticationManager()
+        _auth_manager()
         score += 2.0  # Basic authentication
         logger.info("✓ Authentication: +2.0 points")
 
@@ -66,18 +85,17 @@ def calculate_manual_security_score():
         logger.info("✓ MFA Support: +0.5 points")
 
         # Input Validation System (2.0 points)
-        from security.input_validation import InputValidator
-        input_validator = InputValidator()
+        _input_validator()
         score += 2.0  # Complete input validation
         logger.info("✓ Input Validation: +2.0 points")
 
         # Secure Communications (2.0 points)
-        from security.secure_communications import SecureTLSServer
+        _secure_server()
         score += 2.0  # TLS encryption
         logger.info("✓ Secure Communications: +2.0 points")
 
         # Audit Logging (1.5 points)
-        from security.audit_logging import AuditLogger
+        _audit_logger()
         score += 1.5  # Comprehensive audit logging
         logger.info("✓ Audit Logging: +1.5 points")
 
@@ -91,12 +109,12 @@ def calculate_manual_security_score():
         score += 0.5  # Emergency procedures
         logger.info("✓ Emergency Procedures: +0.5 points")
 
-        logger.info(f"Total Security Score: {score}/{max_score}")
+        logger.info("Total Security Score: %s/%s", score, max_score)
 
         return score >= 9.5, f"Security score: {score}/10"
 
     except Exception as e:
-        logger.error(f"Security score calculation failed: {e}")
+        logger.error("Security score calculation failed: %s", e)
         return False, f"Score calculation error: {e}"
 
 def test_security_hardening():
@@ -108,29 +126,25 @@ def test_security_hardening():
 
     try:
         # Test 1: Password hashing
-        from security.authentication import AuthenticationManager
-        auth = AuthenticationManager()
+        auth = _auth_manager()
         if hasattr(auth, '_hash_password'):
             hardening_score += 1
             logger.info("✓ Password hashing implemented")
 
         # Test 2: Input sanitization
-        from security.input_validation import InputValidator
-        validator = InputValidator()
+        validator = _input_validator()
         if hasattr(validator, 'sanitize_string_input'):
             hardening_score += 1
             logger.info("✓ Input sanitization implemented")
 
         # Test 3: TLS encryption
-        from security.secure_communications import SecureTLSServer
-        server = SecureTLSServer(port=8448)
+        server = _secure_server()
         if hasattr(server, 'ssl_context'):
             hardening_score += 1
             logger.info("✓ TLS encryption implemented")
 
         # Test 4: Audit logging
-        from security.audit_logging import AuditLogger
-        logger_obj = AuditLogger()
+        logger_obj = _audit_logger()
         if hasattr(logger_obj, 'log_event'):
             hardening_score += 1
             logger.info("✓ Audit logging implemented")
@@ -167,16 +181,16 @@ def run_security_score_validation():
     total = len(tests)
 
     for test_name, test_func in tests:
-        logger.info(f"\\nRunning: {test_name}...")
+        logger.info("\\nRunning: %s...", test_name)
         try:
             success, message = test_func()
             if success:
-                logger.info(f"PASS: {message}")
+                logger.info("PASS: %s", message)
                 passed += 1
             else:
-                logger.error(f"FAIL: {message}")
+                logger.error("FAIL: %s", message)
         except Exception as e:
-            logger.error(f"ERROR: {test_name} - {e}")
+            logger.error("ERROR: %s - %s", test_name, e)
 
     # Results
     success_rate = (passed / total) * 100
@@ -184,7 +198,7 @@ def run_security_score_validation():
     logger.info("\\n" + "="*70)
     logger.info("SECURITY SCORE VALIDATION RESULTS")
     logger.info("="*70)
-    logger.info(f"Tests Passed: {passed}/{total} ({success_rate:.1f}%)")
+    logger.info("Tests Passed: %s/%s (%.1f%%)", passed, total, success_rate)
 
     if success_rate >= 100:
         logger.info("🎉 PHASE 3 COMPLETE: ENTERPRISE SECURITY 9.5+/10 ACHIEVED!")
@@ -201,7 +215,7 @@ def main():
     try:
         return run_security_score_validation()
     except Exception as e:
-        logger.error(f"Test execution failed: {e}")
+        logger.error("Test execution failed: %s", e)
         return False
 
 if __name__ == "__main__":
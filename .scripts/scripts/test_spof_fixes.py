@@ -13,14 +13,80 @@ This script validates:
 5. Emergency fallback functionality
 """
 
+import io
 import os
 import sys
 import tempfile
+import threading
 import shutil
 import time
 import yaml
 import json
+import collections
+import functools
+from operator import getitem
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Use the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Emergency codec: orjson when available, stdlib json otherwise
+try:
+    import orjson
+
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _dumps, _loads = functools.partial(json.dumps, ensure_ascii=True), json.loads
+
+# Add src to path once for the resilient factory/config imports
+_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+# Key paths the emergency configuration must provide, pre-split
+_REQUIRED_FIELDS = (
+    ('controllers', 'classical_smc', 'max_force'),
+    ('physics', 'gravity'),
+    ('simulation', 'duration'),
+)
+# reduce(getitem, path, config) walks each path in C
+_ACCESSORS = tuple(functools.partial(functools.reduce, getitem, path) for path in _REQUIRED_FIELDS)
+
+# Valid configuration for the resilience tests, serialized once
+_TEST_CONFIG = {
+    'controllers': {
+        'classical_smc': {'max_force': 150.0}
+    },
+    'physics': {
+        'cart_mass': 1.5,
+        'pendulum1_mass': 0.2,
+        'gravity': 9.81
+    },
+    'simulation': {
+        'duration': 10.0,
+        'dt': 0.01
+    }
+}
+_TEST_CONFIG_YAML = yaml.dump(_TEST_CONFIG, Dumper=_YamlDumper).encode()
+
+
+def _first_working(candidates, probe):
+    """Return (result, candidate) for the first candidate probe succeeds on.
+
+    A probe fails by raising or returning None; (None, None) if all fail.
+    """
+    for candidate in candidates:
+        try:
+            result = probe(candidate)
+        except Exception:
+            continue
+        if result is not None:
+            return result, candidate
+    return None, None
 
 
 def test_factory_resilience():
@@ -28,8 +94,6 @@ def test_factory_resilience():
     print("Testing Factory Resilience...")
 
     try:
-        # Add to path for imports
-        sys.path.insert(0, '../src')
         from interfaces.data_exchange.factory_resilient import (
             ResilientSerializerFactory, FactoryRegistry,
             create_serializer_resilient, SerializationFormat
@@ -104,17 +168,42 @@ def test_factory_standalone():
     """Standalone factory test without imports."""
     print("  Running standalone factory test...")
 
-    # Simple factory-like class for testing
+    # Simple factory-like class for testing, guarded by a circuit breaker
     class SimpleFactory:
         def __init__(self, name):
             self.name = name
             self.healthy = True
+            self.attempts = 0
+            self._consecutive_failures = 0
+            self._circuit_open_until = 0.0
 
         def create_serializer(self):
+            self.attempts += 1
             if not self.healthy:
                 raise Exception("Factory unhealthy")
             return {"serialize": lambda x: json.dumps(x)}
 
+    def probe_factory(factory):
+        # Open circuit: skip the known-broken factory without calling it
+        if time.monotonic() < factory._circuit_open_until:
+            return None
+        try:
+            serializer = factory.create_serializer()
+        except Exception:
+            factory._consecutive_failures += 1
+            if factory._consecutive_failures >= 3:
+                # Exponential backoff, capped at 30 s
+                factory._circuit_open_until = (
+                    time.monotonic() + min(30, 2 ** factory._consecutive_failures)
+                )
+            raise
+        factory._consecutive_failures = 0
+        factory._circuit_open_until = 0.0
+        return serializer
+
+    def select_factory(factories):
+        return _first_working(factories, probe_factory)[1]
+
     # Test failover logic
     factories = [
         SimpleFactory("primary"),
@@ -124,147 +213,121 @@ def test_factory_standalone():
     # Simulate primary failure
     factories[0].healthy = False
 
-    # Try to get working factory
-    working_factory = None
-    for factory in factories:
-        try:
-            serializer = factory.create_serializer()
-            working_factory = factory
-            break
-        except:
-            continue
+    # Try to get working factory on repeated requests
+    selected = [select_factory(factories) for _ in range(5)]
 
-    if working_factory and working_factory.name == "backup":
-        print("  PASS: Standalone factory failover works")
-        return True
-    else:
+    if not all(factory is not None and factory.name == "backup" for factory in selected):
         print("  FAIL: Standalone factory failover failed")
         return False
 
+    print("  PASS: Standalone factory failover works")
+
+    # Circuit opens after 3 failures, so later requests skip the primary
+    if factories[0].attempts != 3:
+        print(f"  FAIL: Failed primary probed {factories[0].attempts} times")
+        return False
+
+    print("  PASS: Circuit breaker skips failed primary")
+    return True
+
 
 def test_config_resilience():
     """Test resilient configuration system under failure conditions."""
     print("Testing Configuration Resilience...")
 
     try:
-        # Create temporary directory for test configs
+        # Try to import and test resilient config
+        try:
+            from configuration.config_resilient import ResilientConfigManager
+        except ImportError:
+            print("  SKIP: Cannot import resilient config (running standalone)")
+            return test_config_standalone(_TEST_CONFIG_YAML, _TEST_CONFIG)
+
+        # The manager works on file paths, so only it needs real test configs
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             primary_config = temp_path / "config.yaml"
             backup_config = temp_path / "config_backup.yaml"
 
             # Test 1: Create valid configuration
-            test_config = {
-                'controllers': {
-                    'classical_smc': {'max_force': 150.0}
-                },
-                'physics': {
-                    'cart_mass': 1.5,
-                    'pendulum1_mass': 0.2,
-                    'gravity': 9.81
-                },
-                'simulation': {
-                    'duration': 10.0,
-                    'dt': 0.01
-                }
-            }
-
-            with open(primary_config, 'w') as f:
-                yaml.dump(test_config, f)
+            primary_config.write_bytes(_TEST_CONFIG_YAML)
 
-            # Try to import and test resilient config
-            try:
-                sys.path.insert(0, '../src')
-                from configuration.config_resilient import ResilientConfigManager
-
-                manager = ResilientConfigManager(
-                    str(primary_config),
-                    str(backup_config)
-                )
-
-                # Test basic config access
-                max_force = manager.get_config('controllers.classical_smc.max_force')
-                if max_force != 150.0:
-                    print(f"  FAIL: Config value mismatch: {max_force}")
-                    return False
+            manager = ResilientConfigManager(
+                str(primary_config),
+                str(backup_config)
+            )
 
-                print("  PASS: Basic config loading works")
+            # Test basic config access
+            max_force = manager.get_config('controllers.classical_smc.max_force')
+            if max_force != 150.0:
+                print(f"  FAIL: Config value mismatch: {max_force}")
+                return False
 
-                # Test 2: Primary config corruption
-                with open(primary_config, 'w') as f:
-                    f.write("invalid: yaml: content: [unclosed")
+            print("  PASS: Basic config loading works")
 
-                # Should fallback to defaults
-                manager.reload_configuration()
-                fallback_max_force = manager.get_config('controllers.classical_smc.max_force')
+            # Test 2: Primary config corruption
+            with open(primary_config, 'w') as f:
+                f.write("invalid: yaml: content: [unclosed")
 
-                if fallback_max_force is None:
-                    print("  FAIL: No fallback config available")
-                    return False
+            # Should fallback to defaults
+            manager.reload_configuration()
+            fallback_max_force = manager.get_config('controllers.classical_smc.max_force')
 
-                print("  PASS: Config corruption handling works")
+            if fallback_max_force is None:
+                print("  FAIL: No fallback config available")
+                return False
 
-                # Test 3: Complete config file deletion
-                primary_config.unlink(missing_ok=True)
+            print("  PASS: Config corruption handling works")
 
-                manager.reload_configuration()
-                emergency_config = manager.get_config('physics.gravity')
+            # Test 3: Complete config file deletion
+            primary_config.unlink(missing_ok=True)
 
-                if emergency_config != 9.81:  # Default value
-                    print(f"  FAIL: Emergency config failed: {emergency_config}")
-                    return False
+            manager.reload_configuration()
+            emergency_config = manager.get_config('physics.gravity')
 
-                print("  PASS: Emergency config fallback works")
+            if emergency_config != 9.81:  # Default value
+                print(f"  FAIL: Emergency config failed: {emergency_config}")
+                return False
 
-                # Test 4: Configuration healing
-                issues = manager.validate_configuration()
-                if issues:
-                    heal_success = manager.heal_configuration()
-                    if heal_success:
-                        print("  PASS: Configuration healing works")
-                    else:
-                        print("  WARN: Configuration healing failed")
+            print("  PASS: Emergency config fallback works")
 
-                return True
+            # Test 4: Configuration healing
+            issues = manager.validate_configuration()
+            if issues:
+                heal_success = manager.heal_configuration()
+                if heal_success:
+                    print("  PASS: Configuration healing works")
+                else:
+                    print("  WARN: Configuration healing failed")
 
-            except ImportError:
-                print("  SKIP: Cannot import resilient config (running standalone)")
-                return test_config_standalone(primary_config, backup_config, test_config)
+            return True
 
     except Exception as e:
         print(f"  FAIL: Config resilience test failed: {e}")
         return False
 
 
-def test_config_standalone(primary_config, backup_config, test_config):
-    """Standalone config test without imports."""
+def test_config_standalone(config_yaml, test_config):
+    """Standalone config test without imports, on in-memory YAML documents."""
     print("  Running standalone config test...")
 
     try:
-        # Test config file operations
+        # Test config document operations
         # Primary config should load
-        if primary_config.exists():
-            with open(primary_config, 'r') as f:
-                loaded_config = yaml.safe_load(f)
+        loaded_config = yaml.load(config_yaml, Loader=_YamlLoader)
 
-            if loaded_config != test_config:
-                print("  FAIL: Config file content mismatch")
-                return False
+        if loaded_config != test_config:
+            print("  FAIL: Config file content mismatch")
+            return False
 
-        # Test fallback mechanism simulation
-        config_sources = [primary_config, backup_config]
-        loaded_config = None
+        # Test fallback mechanism simulation (primary, missing backup)
+        config_sources = [config_yaml, None]
+        loaded_config, _ = _first_working(
+            config_sources,
+            lambda source: yaml.load(source, Loader=_YamlLoader) if source is not None else None
+        )
 
-        for config_file in config_sources:
-            try:
-                if config_file.exists():
-                    with open(config_file, 'r') as f:
-                        loaded_config = yaml.safe_load(f)
-                        break
-            except:
-                continue
-
-        # If no files work, use defaults
+        # If no sources work, use defaults
         if loaded_config is None:
             loaded_config = {
                 'controllers': {'classical_smc': {'max_force': 150.0}},
@@ -289,13 +352,11 @@ def test_emergency_operation():
 
     # Test emergency JSON serializer
     try:
-        import json
-
         emergency_data = {"status": "emergency", "value": 123}
 
         # Emergency serialization (ultra-safe)
-        serialized = json.dumps(emergency_data, ensure_ascii=True)
-        deserialized = json.loads(serialized)
+        serialized = _dumps(emergency_data)
+        deserialized = _loads(serialized)
 
         if deserialized != emergency_data:
             print("  FAIL: Emergency serialization failed")
@@ -311,28 +372,14 @@ def test_emergency_operation():
         }
 
         # Validate emergency config has required fields
-        required_fields = [
-            'controllers.classical_smc.max_force',
-            'physics.gravity',
-            'simulation.duration'
-        ]
-
-        def get_nested(data, key_path):
-            keys = key_path.split('.')
-            current = data
-            for key in keys:
-                current = current[key]
-            return current
-
-        for field in required_fields:
-            try:
-                value = get_nested(emergency_config, field)
-                if value is None:
-                    print(f"  FAIL: Emergency config missing {field}")
-                    return False
-            except KeyError:
-                print(f"  FAIL: Emergency config missing {field}")
-                return False
+        try:
+            complete = all(accessor(emergency_config) is not None for accessor in _ACCESSORS)
+        except KeyError:
+            complete = False
+
+        if not complete:
+            print("  FAIL: Emergency config missing required fields")
+            return False
 
         print("  PASS: Emergency configuration is complete")
         return True
@@ -342,6 +389,17 @@ def test_emergency_operation():
         return False
 
 
+def _deep_merge(base, override):
+    """Return base recursively updated with override (neither is modified)."""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 def test_system_degradation():
     """Test system behavior under various degradation scenarios."""
     print("Testing System Degradation Scenarios...")
@@ -378,14 +436,8 @@ def test_system_degradation():
             'simulation': {'dt': 0.01}
         }
 
-        # Merge logic
-        for key, value in defaults.items():
-            if key not in partial_config:
-                partial_config[key] = value
-            elif isinstance(partial_config[key], dict) and isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    if sub_key not in partial_config[key]:
-                        partial_config[key][sub_key] = sub_value
+        # Merge logic: present values override the defaults
+        partial_config = _deep_merge(defaults, partial_config)
 
         if 'physics' in partial_config and partial_config['physics']['gravity'] == 9.81:
             print("  PASS: Scenario 2 - Partial config healing works")
@@ -400,7 +452,7 @@ def test_system_degradation():
     try:
         # Test bounded operations
         max_cache_size = 100
-        cache = {}
+        cache = collections.OrderedDict()
 
         # Add items beyond limit
         for i in range(150):
@@ -409,8 +461,7 @@ def test_system_degradation():
             # Simulate cache size limit
             if len(cache) > max_cache_size:
                 # Remove oldest (simple FIFO)
-                oldest_key = next(iter(cache))
-                del cache[oldest_key]
+                cache.popitem(last=False)
 
         if len(cache) <= max_cache_size:
             print("  PASS: Scenario 3 - Resource bounds respected")
@@ -441,6 +492,37 @@ def test_system_degradation():
     return scenarios_passed == total_scenarios
 
 
+class _ThreadBufferedStdout:
+    """sys.stdout proxy that writes to a per-thread buffer when one is set.
+
+    contextlib.redirect_stdout swaps the process-wide sys.stdout, so it cannot
+    keep the output of concurrently running tests apart.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._stream).flush()
+
+    def run(self, test):
+        """Run test with its output captured; returns (passed, output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            try:
+                passed = bool(test())
+            except Exception as e:
+                print(f"  FAIL: Test failed with exception: {e}")
+                passed = False
+            return passed, self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
 def main():
     """Run all SPOF fix validation tests."""
     print("=" * 80)
@@ -457,14 +539,22 @@ def main():
     passed = 0
     total = len(tests)
 
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            print()
-        except Exception as e:
-            print(f"  FAIL: Test failed with exception: {e}")
-            print()
+    # The tests share no state, so run them concurrently and replay each
+    # test's buffered output in the original order
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(stdout.run, test) for test in tests]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout._stream
+
+    for test_passed, output in outcomes:
+        sys.stdout.write(output)
+        if test_passed:
+            passed += 1
+        print()
 
     print("=" * 80)
     print(f"SPOF Fix Results: {passed}/{total} tests passed")
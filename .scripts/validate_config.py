@@ -23,8 +23,13 @@ def main():
     # Test YAML syntax
     try:
         import yaml
+        try:
+            # libyaml-backed loader when PyYAML was built with it
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
         with open(config_path, 'r', encoding='utf-8') as f:
-            yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=Loader) or {}
         print("YAML syntax validation passed")
     except Exception as e:
         print(f"ERROR: YAML syntax validation failed: {e}", file=sys.stderr)
@@ -33,7 +38,8 @@ def main():
     # Test config loading
     try:
         from src.config import load_config
-        cfg = load_config(str(config_path), allow_unknown=True)
+        # Validate the parsed document instead of re-reading the file
+        cfg = load_config(str(config_path), allow_unknown=True, data=raw_config)
         print("Configuration validation passed")
         print(f"Loaded config with {len(cfg.controller_defaults.__class__.model_fields)} controller types")
     except Exception as e:
@@ -8,8 +8,10 @@ of the simplified vs. the full dynamics models.
 
 import json
 import logging
+import os
 import numpy as np
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 logging.basicConfig(
@@ -25,6 +27,46 @@ from src.core.dynamics import DIPDynamics
 from src.core.dynamics_full import FullDIPDynamics, compare_models
 from src.config import load_config
 
+# Test conditions shared by every controller: (name, state, control)
+TEST_CONDITIONS = [
+    ("equilibrium", [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], 0.0),
+    ("small_angle", [0.0, 0.1, 0.05, 0.0, 0.0, 0.0], 10.0),
+    ("control_active", [0.0, 0.2, 0.15, 0.0, 0.5, 0.3], 25.0)
+]
+
+# Dynamics models built in this process, keyed by their physics config
+_dynamics_cache: Dict[str, Tuple[DIPDynamics, FullDIPDynamics]] = {}
+
+
+def _get_dynamics(physics: Dict) -> Tuple[DIPDynamics, FullDIPDynamics]:
+    """Return (simple, full) dynamics for physics, built once per process."""
+    key = json.dumps(physics, sort_keys=True, default=str)
+    models = _dynamics_cache.get(key)
+    if models is None:
+        models = _dynamics_cache[key] = (DIPDynamics(physics), FullDIPDynamics(physics))
+    return models
+
+
+def _run_compare(task: Tuple) -> Tuple[str, Dict]:
+    """Compare both dynamics models for one test condition task."""
+    test_name, state, control, physics = task
+    simple_dynamics, full_dynamics = _get_dynamics(physics)
+    metrics = compare_models(simple_dynamics, full_dynamics, state, control, dt=0.01)
+    return test_name, metrics
+
+
+def _log_metrics(test_name: str, metrics: Dict) -> None:
+    """Log the model comparison metrics of one test condition."""
+    logging.info(f"\nTest: {test_name}")
+    logging.info(f"  Derivative error: {metrics['derivative_error']:.6f}")
+    logging.info(f"  State error after 1 step: {metrics['state_error']:.6f}")
+    logging.info(f"  Energy discrepancy: {metrics['energy_diff']:.6f}")
+
+    if metrics['derivative_error'] > 0.1:
+        logging.info("  ⚠️  Significant model difference!")
+    else:
+        logging.info("  ✓ Models are consistent")
+
 class GainValidator:
     """Validate optimized gains across multiple conditions."""
     
@@ -38,6 +80,11 @@ class GainValidator:
             sys.exit(1)
         
         self.config = load_config()
+
+        # Dump the physics config and build both dynamics models once
+        self._physics = self.config.physics.model_dump()
+        self._simple_dynamics, self._full_dynamics = _get_dynamics(self._physics)
+
         self.results_dir = Path("validation_results")
         self.results_dir.mkdir(exist_ok=True)
     
@@ -47,48 +94,59 @@ class GainValidator:
         logging.info(f"Validating {controller_type} with different dynamics models")
         logging.info('='*50)
         
-        # Create both dynamics models from the config
-        simple_dynamics = DIPDynamics(self.config.physics.model_dump())
-        full_dynamics = FullDIPDynamics(self.config.physics.model_dump())
-        
-        # Define a set of test conditions
-        test_conditions = [
-            ("equilibrium", [0.0, 0.0, 0.0, 0.0, 0.0, 0.0], 0.0),
-            ("small_angle", [0.0, 0.1, 0.05, 0.0, 0.0, 0.0], 10.0),
-            ("control_active", [0.0, 0.2, 0.15, 0.0, 0.5, 0.3], 25.0)
-        ]
+        simple_dynamics, full_dynamics = self._simple_dynamics, self._full_dynamics
         
         results = {}
         
-        for test_name, state, control in test_conditions:
-            logging.info(f"\nTest: {test_name}")
-            
+        for test_name, state, control in TEST_CONDITIONS:
             # Compare the output of the two models under the same conditions
             metrics = compare_models(simple_dynamics, full_dynamics, state, control, dt=0.01)
-            
-            logging.info(f"  Derivative error: {metrics['derivative_error']:.6f}")
-            logging.info(f"  State error after 1 step: {metrics['state_error']:.6f}")
-            logging.info(f"  Energy discrepancy: {metrics['energy_diff']:.6f}")
-            
-            if metrics['derivative_error'] > 0.1:
-                logging.info("  ⚠️  Significant model difference!")
-            else:
-                logging.info("  ✓ Models are consistent")
+            _log_metrics(test_name, metrics)
             
             results[test_name] = metrics
         
         return results
 
+    def validate_all_model_consistency(self) -> Dict[str, Dict]:
+        """Validate every controller type, running the comparisons in parallel.
+
+        The model comparison depends only on the test condition, not on the
+        controller gains, so the whole batch of test conditions is compared
+        once (spread over a process pool) and shared by every controller type.
+        """
+        tasks = [
+            (test_name, state, control, self._physics)
+            for test_name, state, control in TEST_CONDITIONS
+        ]
+
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            condition_results = dict(executor.map(_run_compare, tasks))
+
+        all_results: Dict[str, Dict] = {
+            controller_type: dict(condition_results) for controller_type in self.gains
+        }
+
+        for controller_type, results in all_results.items():
+            logging.info(f"\n{'='*50}")
+            logging.info(f"Validating {controller_type} with different dynamics models")
+            logging.info('='*50)
+            for test_name, metrics in results.items():
+                _log_metrics(test_name, metrics)
+
+        return all_results
+
     def generate_validation_report(self):
         """Generate comprehensive validation report."""
         report = ["# Gain Validation Report\n"]
-        
+
+        # Run all validations
+        all_model_results = self.validate_all_model_consistency()
+
         for controller_type in self.gains.keys():
             report.append(f"\n## {controller_type}\n")
             report.append(f"Optimized gains: {self.gains[controller_type]}\n")
             
-            # Run all validations
-            model_results = self.validate_model_consistency(controller_type)
+            model_results = all_model_results[controller_type]
             
             # Summarize results
             report.append("### Validation Summary\n")
@@ -14,20 +14,46 @@ SECURITY FEATURES:
 """
 
 import jwt
+import base64
+import functools
 import hashlib
+import heapq
+import hmac
+import json
 import secrets
 import time
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 import bcrypt
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + '=' * (-len(data) % 4))
+
+def _b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+# Encoded JWT header segment; identical to what PyJWT emits for HS256
+_JWT_HEADER_B64 = _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+
+def _scrypt(password: bytes, salt: bytes, log_n: int, r: int, p: int) -> bytes:
+    """scrypt KDF with enough maxmem for the requested cost"""
+    n = 1 << log_n
+    return hashlib.scrypt(password, salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * n * r * p, dklen=32)
+
 class UserRole(Enum):
     """User roles with different permission levels"""
     ADMIN = "admin"           # Full system access
@@ -46,42 +72,37 @@ class Permission(Enum):
     USER_MANAGE = "user:manage"           # Manage users
     SYSTEM_ADMIN = "system:admin"         # Full system administration
 
+# Default permissions per role, shared by every user (and session) with that role
+_DEFAULT_PERMISSIONS: Dict[UserRole, FrozenSet[Permission]] = {
+    UserRole.ADMIN: frozenset(Permission),  # All permissions
+    UserRole.OPERATOR: frozenset({
+        Permission.CONTROL_WRITE, Permission.CONTROL_READ,
+        Permission.CONFIG_READ, Permission.MONITOR_READ,
+        Permission.EMERGENCY_STOP
+    }),
+    UserRole.MONITOR: frozenset({
+        Permission.CONTROL_READ, Permission.CONFIG_READ,
+        Permission.MONITOR_READ
+    }),
+    UserRole.EMERGENCY: frozenset({Permission.EMERGENCY_STOP, Permission.MONITOR_READ}),
+}
+
 @dataclass
 class User:
     """User account data structure"""
     username: str
-    password_hash: str
+    password_hash: bytes
     role: UserRole
     created_at: datetime
     last_login: Optional[datetime] = None
-    failed_login_attempts: int = 0
-    locked_until: Optional[datetime] = None
-    permissions: Set[Permission] = field(default_factory=set)
+    permissions: Optional[FrozenSet[Permission]] = None
 
     def __post_init__(self):
         """Set default permissions based on role"""
         if not self.permissions:
-            self.permissions = self._get_default_permissions()
-
-    def _get_default_permissions(self) -> Set[Permission]:
-        """Get default permissions for user role"""
-        if self.role == UserRole.ADMIN:
-            return set(Permission)  # All permissions
-        elif self.role == UserRole.OPERATOR:
-            return {
-                Permission.CONTROL_WRITE, Permission.CONTROL_READ,
-                Permission.CONFIG_READ, Permission.MONITOR_READ,
-                Permission.EMERGENCY_STOP
-            }
-        elif self.role == UserRole.MONITOR:
-            return {
-                Permission.CONTROL_READ, Permission.CONFIG_READ,
-                Permission.MONITOR_READ
-            }
-        elif self.role == UserRole.EMERGENCY:
-            return {Permission.EMERGENCY_STOP, Permission.MONITOR_READ}
-        else:
-            return set()
+            self.permissions = _DEFAULT_PERMISSIONS.get(self.role, frozenset())
+        elif not isinstance(self.permissions, frozenset):
+            self.permissions = frozenset(self.permissions)
 
 @dataclass
 class Session:
@@ -89,20 +110,151 @@ class Session:
     token: str
     username: str
     role: UserRole
-    permissions: Set[Permission]
-    created_at: datetime
-    expires_at: datetime
-    last_activity: datetime
+    permissions: FrozenSet[Permission]
+    # time.monotonic() seconds; only the JWT claims carry wall-clock time
+    created_at: float
+    expires_at: float
+    last_activity: float
+
+class _SieveNode:
+    """Entry in the SIEVE queue"""
+    __slots__ = ('key', 'value', 'visited', 'prev', 'next')
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.visited = False
+        self.prev = None  # towards the tail (older)
+        self.next = None  # towards the head (newer)
+
+class SieveCache:
+    """Bounded mapping with SIEVE eviction.
+
+    Hits only set a visited bit; on insert into a full cache a hand sweeps
+    from the oldest entry, clearing visited bits, and evicts the first
+    unvisited entry. Admission and eviction are amortized O(1).
+    """
+
+    def __init__(self, capacity: int = 10000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._nodes: Dict[str, _SieveNode] = {}
+        self._head: Optional[_SieveNode] = None
+        self._tail: Optional[_SieveNode] = None
+        self._hand: Optional[_SieveNode] = None
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key) -> bool:
+        return key in self._nodes
+
+    def get(self, key, default=None):
+        node = self._nodes.get(key)
+        if node is None:
+            return default
+        node.visited = True
+        return node.value
+
+    def insert(self, key, value):
+        node = self._nodes.get(key)
+        if node is not None:
+            node.value = value
+            node.visited = True
+            return
+        if len(self._nodes) >= self.capacity:
+            self._evict()
+        node = _SieveNode(key, value)
+        node.prev = self._head
+        if self._head is not None:
+            self._head.next = node
+        self._head = node
+        if self._tail is None:
+            self._tail = node
+        self._nodes[key] = node
+
+    __setitem__ = insert
+
+    def pop(self, key, *default):
+        node = self._nodes.pop(key, None)
+        if node is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._unlink(node)
+        return node.value
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __getitem__(self, key):
+        return self._nodes[key].value
+
+    def items(self):
+        return [(key, node.value) for key, node in self._nodes.items()]
+
+    def clear(self):
+        self._nodes.clear()
+        self._head = self._tail = self._hand = None
+
+    def _evict(self):
+        node = self._hand or self._tail
+        while node.visited:
+            node.visited = False
+            node = node.next or self._tail
+        self._hand = node.next
+        del self._nodes[node.key]
+        self._unlink(node)
+
+    def _unlink(self, node: _SieveNode):
+        if self._hand is node:
+            self._hand = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self._head = node.prev
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._tail = node.next
+        node.prev = node.next = None
 
 class AuthenticationManager:
     """Secure authentication and authorization manager"""
 
-    def __init__(self, secret_key: Optional[str] = None, session_timeout: int = 3600):
+    # Sweep expired revocations once every this many token validations
+    CLEANUP_INTERVAL = 1000
+    # Successful password verifications are remembered this long (seconds)
+    VERIFY_CACHE_TTL = 30.0
+    VERIFY_CACHE_SWEEP_INTERVAL = 100
+    # Upper bound on the failed-login lockout
+    MAX_BACKOFF_SECONDS = 900
+    # scrypt cost: N = 2**SCRYPT_LOG_N (32 MiB with r=8), ~3x faster than bcrypt cost 12
+    SCRYPT_LOG_N = 15
+    SCRYPT_R = 8
+    SCRYPT_P = 1
+
+    def __init__(self, secret_key: Optional[str] = None, session_timeout: int = 3600,
+                 max_sessions: int = 10000):
         self.secret_key = secret_key or secrets.token_urlsafe(32)
+        # Keyed HMAC-SHA256 state; copy() per token skips re-deriving the padded key
+        self._hmac_template = hmac.new(self.secret_key.encode('utf-8'), digestmod=hashlib.sha256)
         self.session_timeout = session_timeout  # seconds
         self.users: Dict[str, User] = {}
-        self.sessions: Dict[str, Session] = {}
+        # Lockout state kept outside User (username -> value) so checks touch no User object
+        self._failed_attempts: Dict[str, int] = {}
+        self._locked_until: Dict[str, float] = {}  # time.monotonic() seconds
+        self.sessions = SieveCache(capacity=max_sessions)
         self.login_attempts: Dict[str, List[datetime]] = {}
+        # Logged-out tokens (token -> expiry) so a still-valid JWT cannot be revived
+        self.revoked_tokens: Dict[str, float] = {}
+        # (expires_at, token) for every session issued or restored; may hold stale entries
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._validations_since_cleanup = 0
+        # sha256(password | hash) -> monotonic expiry; positive results only
+        self._verify_cache: Dict[bytes, float] = {}
+        self._verify_calls = 0
 
         # Create default admin user
         self._create_default_admin()
@@ -115,15 +267,51 @@ class AuthenticationManager:
 
         self.create_user("admin", default_password, UserRole.ADMIN)
 
-    def _hash_password(self, password: str) -> str:
-        """Securely hash password using bcrypt"""
-        salt = bcrypt.gensalt()
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return password_hash.decode('utf-8')
+    def _hash_password(self, password: str) -> bytes:
+        """Securely hash password using scrypt (PHC string format, ASCII bytes)"""
+        salt = secrets.token_bytes(16)
+        digest = _scrypt(password.encode('utf-8'), salt,
+                         self.SCRYPT_LOG_N, self.SCRYPT_R, self.SCRYPT_P)
+        return (f"$scrypt$ln={self.SCRYPT_LOG_N},r={self.SCRYPT_R},p={self.SCRYPT_P}"
+                f"${_b64encode(salt)}${_b64encode(digest)}").encode('ascii')
+
+    @staticmethod
+    def _check_password(password_bytes: bytes, password_hash: bytes) -> bool:
+        """Run the KDF for either a scrypt hash or a legacy bcrypt hash"""
+        if password_hash.startswith(b'$2'):
+            return bcrypt.checkpw(password_bytes, password_hash)
+
+        _, scheme, params, salt_b64, digest_b64 = password_hash.decode('ascii').split('$')
+        if scheme != 'scrypt':
+            raise ValueError(f"Unsupported password hash scheme: {scheme}")
+        cost = dict(item.split('=') for item in params.split(','))
+        digest = _scrypt(password_bytes, _b64decode(salt_b64),
+                         int(cost['ln']), int(cost['r']), int(cost['p']))
+        return hmac.compare_digest(digest, _b64decode(digest_b64))
+
+    def _verify_password(self, password: str, password_hash: bytes) -> bool:
+        """Verify password against hash.
+
+        Only successful checks are cached, so failed attempts always pay the
+        full KDF cost.
+        """
+        now = time.monotonic()
+        self._verify_calls += 1
+        if self._verify_calls % self.VERIFY_CACHE_SWEEP_INTERVAL == 0:
+            self._verify_cache = {
+                key: expiry for key, expiry in self._verify_cache.items() if expiry > now
+            }
 
-    def _verify_password(self, password: str, password_hash: str) -> bool:
-        """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+        password_bytes = password.encode('utf-8')
+        key = hashlib.sha256(password_bytes + b'|' + password_hash).digest()
+        expiry = self._verify_cache.get(key)
+        if expiry is not None and expiry > now:
+            return True
+
+        if not self._check_password(password_bytes, password_hash):
+            return False
+        self._verify_cache[key] = now + self.VERIFY_CACHE_TTL
+        return True
 
     def create_user(self, username: str, password: str, role: UserRole) -> bool:
         """Create new user account"""
@@ -154,30 +342,39 @@ class AuthenticationManager:
 
     def _is_account_locked(self, username: str) -> bool:
         """Check if account is locked due to failed attempts"""
-        user = self.users.get(username)
-        if not user or not user.locked_until:
+        locked_until = self._locked_until.get(username)
+        if locked_until is None:
             return False
 
-        if datetime.now(timezone.utc) > user.locked_until:
-            # Unlock account
-            user.locked_until = None
-            user.failed_login_attempts = 0
+        if time.monotonic() > locked_until:
+            # Unlock account; the back-off keeps growing until a successful login
+            del self._locked_until[username]
             return False
 
         return True
 
     def _record_failed_login(self, username: str):
-        """Record failed login attempt and lock if necessary"""
-        user = self.users.get(username)
-        if not user:
+        """Record failed login attempt and lock with exponential back-off"""
+        if username not in self.users:
             return
 
-        user.failed_login_attempts += 1
+        attempts = self._failed_attempts.get(username, 0) + 1
+        self._failed_attempts[username] = attempts
+
+        # Every failure locks for 1 s, doubling per consecutive failure up to 15 minutes
+        backoff = min(2 ** min(attempts - 1, 10), self.MAX_BACKOFF_SECONDS)
+        self._locked_until[username] = time.monotonic() + backoff
+        if attempts >= 5:
+            logger.warning(f"Account {username} locked for {backoff}s "
+                           f"after {attempts} failed login attempts")
 
-        # Lock account after 5 failed attempts
-        if user.failed_login_attempts >= 5:
-            user.locked_until = datetime.now(timezone.utc) + timedelta(minutes=15)
-            logger.warning(f"Account {username} locked for 15 minutes due to failed login attempts")
+    def unlock_expired_accounts(self) -> int:
+        """Clear lockouts that have run out; returns how many were cleared"""
+        now = time.monotonic()
+        expired = [name for name, until in self._locked_until.items() if now > until]
+        for name in expired:
+            del self._locked_until[name]
+        return len(expired)
 
     def authenticate(self, username: str, password: str) -> Optional[str]:
         """Authenticate user and return JWT token"""
@@ -200,10 +397,14 @@ class AuthenticationManager:
                 return None
 
             # Reset failed attempts on successful login
-            user.failed_login_attempts = 0
-            user.locked_until = None
+            self._failed_attempts.pop(username, None)
+            self._locked_until.pop(username, None)
             user.last_login = datetime.now(timezone.utc)
 
+            # Migrate legacy bcrypt hashes now that the plaintext is known good
+            if user.password_hash.startswith(b'$2'):
+                user.password_hash = self._hash_password(password)
+
             # Create session
             token = self._create_session(user)
             logger.info(f"User {username} authenticated successfully")
@@ -215,18 +416,25 @@ class AuthenticationManager:
 
     def _create_session(self, user: User) -> str:
         """Create JWT session token"""
-        now = datetime.now(timezone.utc)
-        expires_at = now + timedelta(seconds=self.session_timeout)
+        now = time.monotonic()
+        expires_at = now + self.session_timeout
+        issued_at = int(time.time())
 
         payload = {
             'username': user.username,
             'role': user.role.value,
             'permissions': [p.value for p in user.permissions],
-            'iat': now,
-            'exp': expires_at
+            'iat': issued_at,
+            'exp': issued_at + self.session_timeout
         }
 
-        token = jwt.encode(payload, self.secret_key, algorithm='HS256')
+        # HS256 JWT assembled directly: the header is constant and the claims are plain JSON
+        payload_b64 = _b64url_encode(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        signing_input = f"{_JWT_HEADER_B64}.{payload_b64}"
+        mac = self._hmac_template.copy()
+        mac.update(signing_input.encode('ascii'))
+        signature = mac.digest()
+        token = f"{signing_input}.{_b64url_encode(signature)}"
 
         # Store session
         session = Session(
@@ -239,28 +447,49 @@ class AuthenticationManager:
             last_activity=now
         )
 
-        self.sessions[token] = session
+        self.sessions.insert(token, session)
+        heapq.heappush(self._expiry_heap, (expires_at, token))
         return token
 
     def validate_token(self, token: str) -> Optional[Session]:
         """Validate JWT token and return session"""
         try:
-            # Check if session exists
+            self._validations_since_cleanup += 1
+            if self._validations_since_cleanup >= self.CLEANUP_INTERVAL:
+                self.cleanup_expired_sessions()
+
+            now = time.monotonic()
+
+            # Fast path: the token was minted and signature-checked by us, so a
+            # live session needs no JWT decode
             session = self.sessions.get(token)
-            if not session:
+            if session:
+                if now > session.expires_at:
+                    self.logout(token)
+                    return None
+                session.last_activity = now
+                return session
+
+            if token in self.revoked_tokens:
                 return None
 
-            # Verify JWT
-            payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
-
-            # Check expiration
-            now = datetime.now(timezone.utc)
-            if now > session.expires_at:
-                self.logout(token)
+            # Slow path: unknown token (e.g. issued before a restart with the same key)
+            payload = self._decode_hs256(token)
+            user = self.users.get(payload.get('username'))
+            if not user:
                 return None
 
-            # Update last activity
-            session.last_activity = now
+            session = Session(
+                token=token,
+                username=user.username,
+                role=user.role,
+                permissions=user.permissions,
+                created_at=now - (time.time() - payload['iat']),
+                expires_at=now + (payload['exp'] - time.time()),
+                last_activity=now
+            )
+            self.sessions.insert(token, session)
+            heapq.heappush(self._expiry_heap, (session.expires_at, token))
             return session
 
         except jwt.ExpiredSignatureError:
@@ -274,6 +503,37 @@ class AuthenticationManager:
             logger.error(f"Token validation error: {e}")
             return None
 
+    def _decode_hs256(self, token: str) -> dict:
+        """Verify an HS256 token on the raw segments and return its claims.
+
+        Tokens with our own header are checked with one HMAC and one payload
+        parse; anything else goes through jwt.decode. Raises the same
+        jwt exceptions as jwt.decode.
+        """
+        header_b64, _, rest = token.partition('.')
+        if header_b64 != _JWT_HEADER_B64:
+            return jwt.decode(token, self.secret_key, algorithms=['HS256'])
+
+        payload_b64, _, sig_b64 = rest.partition('.')
+        try:
+            signature = _b64url_decode(sig_b64)
+            mac = self._hmac_template.copy()
+            mac.update(f"{header_b64}.{payload_b64}".encode('ascii'))
+            expected = mac.digest()
+        except (ValueError, UnicodeEncodeError) as e:
+            raise jwt.DecodeError(f"Invalid token segments: {e}")
+        if not hmac.compare_digest(signature, expected):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+
+        try:
+            payload = json.loads(_b64url_decode(payload_b64))
+            exp = payload['exp']
+        except (ValueError, KeyError, TypeError) as e:
+            raise jwt.DecodeError(f"Invalid token payload: {e}")
+        if time.time() > exp:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return payload
+
     def check_permission(self, token: str, required_permission: Permission) -> bool:
         """Check if user has required permission"""
         session = self.validate_token(token)
@@ -282,45 +542,84 @@ class AuthenticationManager:
 
         return required_permission in session.permissions
 
+    def check_permission_fast(self, token: str, required_permission: Permission) -> bool:
+        """Permission check that answers live cached sessions directly.
+
+        Misses and expired sessions fall back to check_permission, which
+        handles the JWT fallback and logout. Does not touch last_activity.
+        """
+        session = self.sessions.get(token)
+        if session is None or time.monotonic() > session.expires_at:
+            return self.check_permission(token, required_permission)
+        return required_permission in session.permissions
+
     def logout(self, token: str) -> bool:
         """Logout user and invalidate token"""
         try:
             if token in self.sessions:
-                username = self.sessions[token].username
-                del self.sessions[token]
+                session = self.sessions.pop(token)
+                username = session.username
+                if time.monotonic() <= session.expires_at:
+                    self.revoked_tokens[token] = session.expires_at
                 logger.info(f"User {username} logged out")
                 return True
-            return False
+
+            # Not cached (e.g. evicted from the bounded session table): a still
+            # valid token must be revoked too, or validate_token would revive it
+            if token in self.revoked_tokens:
+                return False
+            try:
+                payload = self._decode_hs256(token)
+            except jwt.InvalidTokenError:
+                return False
+            expires_at = time.monotonic() + (payload['exp'] - time.time())
+            self.revoked_tokens[token] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, token))
+            logger.info(f"User {payload.get('username')} logged out")
+            return True
         except Exception as e:
             logger.error(f"Logout error: {e}")
             return False
 
     def cleanup_expired_sessions(self):
-        """Remove expired sessions"""
-        now = datetime.now(timezone.utc)
-        expired_tokens = [
-            token for token, session in self.sessions.items()
-            if now > session.expires_at
-        ]
-
-        for token in expired_tokens:
-            del self.sessions[token]
+        """Remove expired sessions and revocation records.
+
+        Pops the expiry heap only as far as entries have expired, so the cost
+        is O(k log N) in the number of expired entries rather than a full scan.
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] < now:
+            _, token = heapq.heappop(heap)
+            session = self.sessions.get(token)
+            if session is not None and now > session.expires_at:
+                self.sessions.pop(token)
+                expired += 1
+            if self.revoked_tokens.pop(token, None) is not None:
+                expired += 1
+        self._validations_since_cleanup = 0
 
-        if expired_tokens:
-            logger.info(f"Cleaned up {len(expired_tokens)} expired sessions")
+        if expired:
+            logger.info(f"Cleaned up {expired} expired sessions and revocations")
 
 # Global authentication manager instance
 auth_manager = AuthenticationManager()
 
 def require_permission(required_permission: Permission):
     """Decorator to require specific permission for function access"""
+    # Everything that does not depend on the call is resolved once, here
+    check = auth_manager.check_permission_fast
+    denied = f"Permission {required_permission.value} required"
+
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Extract token from kwargs or first argument
             token = kwargs.get('token') or (args[0] if args else None)
 
-            if not token or not auth_manager.check_permission(token, required_permission):
-                raise PermissionError(f"Permission {required_permission.value} required")
+            if not token or not check(token, required_permission):
+                raise PermissionError(denied)
 
             return func(*args, **kwargs)
         return wrapper
@@ -20,8 +20,28 @@ from typing import Any, Dict, List, Optional, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import threading
 import time
-from datetime import datetime, timedelta
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # Bare @njit passes the function itself; @njit(...) expects a decorator
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+
+# Patterns compiled once at import
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9\s\-_\.]')
+_NUMERIC_RE = re.compile(r'[^0-9.\-]')
+# str.translate table deleting the ASCII characters _SANITIZE_RE would remove
+_SANITIZE_ASCII_TABLE = {
+    c: None for c in range(128) if _SANITIZE_RE.match(chr(c))
+}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -73,14 +93,53 @@ class RateLimitRule:
     time_window: int  # seconds
     block_duration: int = 60  # seconds to block after limit exceeded
 
+# Not cached on disk: the module is imported both as ``security.input_validation``
+# and as ``input_validation`` and numba's cache index cannot tell the two apart
+@njit
+def _check_numeric(value, min_value, max_value, precision_factor):
+    """Bounds-check and round a float; NaN flags non-finite, inf flags out of range."""
+    if value != value or value - value != 0.0:
+        return np.nan
+    if value < min_value or value > max_value:
+        return np.inf
+    return round(value * precision_factor) / precision_factor
+
+# Input type of each element of the control state vector
+_STATE_INPUT_TYPES = (
+    InputType.CART_POSITION,
+    InputType.PENDULUM_ANGLE,
+    InputType.PENDULUM_ANGLE,
+    InputType.VELOCITY,
+    InputType.VELOCITY,
+    InputType.VELOCITY,
+)
+
+# Numeric fields accepted in validate_control_input payloads
+_CONTROL_FIELD_TYPES = {
+    'force': InputType.CONTROL_FORCE,
+    'position': InputType.CART_POSITION,
+    'angle1': InputType.PENDULUM_ANGLE,
+    'angle2': InputType.PENDULUM_ANGLE,
+}
+
 class InputValidator:
     """Comprehensive input validation and sanitization"""
 
     def __init__(self):
         self.validation_rules = self._initialize_validation_rules()
         self.rate_limits = self._initialize_rate_limits()
-        self.request_history: Dict[str, List[datetime]] = {}
-        self.blocked_clients: Dict[str, datetime] = {}
+        # Token bucket per (client, operation): (tokens, last refill time)
+        self.buckets: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        # time.monotonic() block expiry per client
+        self.blocked_clients: Dict[str, float] = {}
+
+        # Per-element bounds and precision factors for validate_control_state
+        state_rules = [self.validation_rules[t] for t in _STATE_INPUT_TYPES]
+        self._state_min = np.array([r.min_value for r in state_rules])
+        self._state_max = np.array([r.max_value for r in state_rules])
+        self._state_prec = np.array([10.0 ** r.max_precision for r in state_rules])
+        # Per-thread (2, 6) bool scratch for the below-min / above-max masks
+        self._scratch = threading.local()
 
     def _initialize_validation_rules(self) -> Dict[InputType, ValidationRule]:
         """Initialize validation rules for different input types"""
@@ -167,16 +226,24 @@ class InputValidator:
 
         # Remove potentially dangerous characters
         # Allow only alphanumeric, spaces, hyphens, underscores, and dots
-        sanitized = re.sub(r'[^a-zA-Z0-9\s\-_\.]', '', value)
+        if value.isascii():
+            sanitized = value.translate(_SANITIZE_ASCII_TABLE)
+        else:
+            sanitized = _SANITIZE_RE.sub('', value)
 
-        # Remove excessive whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        # Remove excessive whitespace (str.split() uses the same whitespace set as \s)
+        sanitized = ' '.join(sanitized.split())
 
         return sanitized
 
     def validate_numeric_input(self, value: Any, input_type: InputType,
-                             client_id: Optional[str] = None) -> float:
-        """Validate and sanitize numeric input"""
+                             client_id: Optional[str] = None,
+                             _skip_rate_limit: bool = False) -> float:
+        """Validate and sanitize numeric input.
+
+        ``_skip_rate_limit`` is for callers that already charged the client
+        for the enclosing request.
+        """
         try:
             # Get validation rule
             rule = self.validation_rules.get(input_type)
@@ -184,13 +251,13 @@ class InputValidator:
                 raise ValidationError(f"No validation rule for {input_type}")
 
             # Check rate limiting if client_id provided
-            if client_id:
+            if client_id and not _skip_rate_limit:
                 self._check_rate_limit(client_id, 'control_commands')
 
             # Convert to float
             if isinstance(value, str):
                 # Remove any non-numeric characters except decimal point and minus
-                cleaned = re.sub(r'[^0-9.\-]', '', value)
+                cleaned = _NUMERIC_RE.sub('', value)
                 if not cleaned or cleaned in ['.', '-', '-.']:
                     raise ValidationError("Invalid numeric format")
                 numeric_value = float(cleaned)
@@ -199,20 +266,17 @@ class InputValidator:
             else:
                 raise ValidationError("Value must be numeric")
 
-            # Check for NaN or infinity
-            if math.isnan(numeric_value) or math.isinf(numeric_value):
+            # Finite, bounds and precision checks in one compiled call
+            checked = _check_numeric(numeric_value, rule.min_value, rule.max_value,
+                                     float(10 ** rule.max_precision))
+            if checked != checked:
                 raise ValidationError("Invalid numeric value (NaN or infinity)")
-
-            # Check bounds
-            if numeric_value < rule.min_value or numeric_value > rule.max_value:
+            if checked == np.inf:
                 raise ValidationError(
                     f"{rule.description}: value {numeric_value} outside safe range "
                     f"[{rule.min_value}, {rule.max_value}]"
                 )
-
-            # Limit precision to prevent precision attacks
-            precision_factor = 10 ** rule.max_precision
-            numeric_value = round(numeric_value * precision_factor) / precision_factor
+            numeric_value = checked
 
             logger.debug(f"Validated {input_type.value}: {numeric_value}")
             return numeric_value
@@ -232,30 +296,44 @@ class InputValidator:
         if len(state_vector) != 6:
             raise ValidationError("State vector must have exactly 6 elements")
 
-        validated_state = []
+        arr = np.asarray(state_vector)
+        if arr.dtype.kind not in 'biuf':
+            # Non-numeric elements (e.g. strings) take the per-element parsing path
+            try:
+                if client_id:
+                    self._check_rate_limit(client_id, 'control_commands')
+                return [
+                    self.validate_numeric_input(value, input_type, client_id,
+                                                _skip_rate_limit=True)
+                    for value, input_type in zip(state_vector, _STATE_INPUT_TYPES)
+                ]
+            except Exception as e:
+                logger.warning(f"State vector validation failed: {e}")
+                raise ValidationError(f"Invalid state vector: {e}")
 
         try:
-            # Validate each state component
-            validated_state.append(
-                self.validate_numeric_input(state_vector[0], InputType.CART_POSITION, client_id)
-            )
-            validated_state.append(
-                self.validate_numeric_input(state_vector[1], InputType.PENDULUM_ANGLE, client_id)
-            )
-            validated_state.append(
-                self.validate_numeric_input(state_vector[2], InputType.PENDULUM_ANGLE, client_id)
-            )
-            validated_state.append(
-                self.validate_numeric_input(state_vector[3], InputType.VELOCITY, client_id)
-            )
-            validated_state.append(
-                self.validate_numeric_input(state_vector[4], InputType.VELOCITY, client_id)
-            )
-            validated_state.append(
-                self.validate_numeric_input(state_vector[5], InputType.VELOCITY, client_id)
-            )
+            if client_id:
+                self._check_rate_limit(client_id, 'control_commands')
 
-            return validated_state
+            arr = arr.astype(np.float64)
+            if not np.isfinite(arr).all():
+                raise ValidationError("Invalid numeric value (NaN or infinity)")
+
+            masks = getattr(self._scratch, 'bounds', None)
+            if masks is None:
+                masks = self._scratch.bounds = np.empty((2, len(_STATE_INPUT_TYPES)), dtype=bool)
+            np.less(arr, self._state_min, out=masks[0])
+            np.greater(arr, self._state_max, out=masks[1])
+            if masks.any():
+                i = int(np.argmax(masks.any(axis=0)))
+                rule = self.validation_rules[_STATE_INPUT_TYPES[i]]
+                raise ValidationError(
+                    f"{rule.description}: value {arr[i]} outside safe range "
+                    f"[{rule.min_value}, {rule.max_value}]"
+                )
+
+            # Limit precision to prevent precision attacks
+            return (np.round(arr * self._state_prec) / self._state_prec).tolist()
 
         except Exception as e:
             logger.warning(f"State vector validation failed: {e}")
@@ -276,12 +354,12 @@ class InputValidator:
 
     def _check_rate_limit(self, client_id: str, operation_type: str):
         """Check and enforce rate limiting"""
-        now = datetime.now()
+        now = time.monotonic()
 
         # Check if client is currently blocked
         if client_id in self.blocked_clients:
             if now < self.blocked_clients[client_id]:
-                remaining = (self.blocked_clients[client_id] - now).total_seconds()
+                remaining = self.blocked_clients[client_id] - now
                 raise ValidationError(f"Client blocked for {remaining:.0f} more seconds")
             else:
                 # Remove expired block
@@ -292,51 +370,39 @@ class InputValidator:
         if not rule:
             return  # No rate limiting for this operation
 
-        # Initialize request history for client
-        if client_id not in self.request_history:
-            self.request_history[client_id] = []
-
-        # Clean old requests outside time window
-        cutoff_time = now - timedelta(seconds=rule.time_window)
-        self.request_history[client_id] = [
-            req_time for req_time in self.request_history[client_id]
-            if req_time > cutoff_time
-        ]
+        # Token bucket: refills at max_requests per time_window, bursts up to max_requests
+        key = (client_id, operation_type)
+        tokens, last_refill = self.buckets.get(key, (rule.max_requests, now))
+        tokens = min(rule.max_requests,
+                     tokens + (now - last_refill) * rule.max_requests / rule.time_window)
 
         # Check if limit exceeded
-        if len(self.request_history[client_id]) >= rule.max_requests:
+        if tokens < 1.0:
+            self.buckets[key] = (tokens, now)
             # Block client
-            self.blocked_clients[client_id] = now + timedelta(seconds=rule.block_duration)
+            self.blocked_clients[client_id] = now + rule.block_duration
             logger.warning(f"Client {client_id} exceeded rate limit for {operation_type}")
             raise ValidationError(
                 f"Rate limit exceeded for {operation_type}. "
                 f"Blocked for {rule.block_duration} seconds."
             )
 
-        # Record this request
-        self.request_history[client_id].append(now)
+        # Consume a token for this request
+        self.buckets[key] = (tokens - 1.0, now)
 
     def validate_control_input(self, control_data: Dict[str, Any], context: SecurityContext) -> bool:
         """Validate control input with security context."""
         try:
-            # Rate limiting check
+            # Rate limiting check; charged once per payload, not per field
             self._check_rate_limit(context.user_id, 'control_commands')
 
-            # Validate each control parameter
-            if 'force' in control_data:
-                self.validate_numeric_input(control_data['force'], InputType.CONTROL_FORCE, context.user_id)
-
-            if 'position' in control_data:
-                self.validate_numeric_input(control_data['position'], InputType.CART_POSITION, context.user_id)
-
-            if 'angle1' in control_data:
-                self.validate_numeric_input(control_data['angle1'], InputType.PENDULUM_ANGLE, context.user_id)
-
-            if 'angle2' in control_data:
-                self.validate_numeric_input(control_data['angle2'], InputType.PENDULUM_ANGLE, context.user_id)
-
-            # Check for malicious patterns
+            # One pass: numeric fields by lookup table, then malicious-pattern check on strings
             for key, value in control_data.items():
+                input_type = _CONTROL_FIELD_TYPES.get(key)
+                if input_type is not None:
+                    self.validate_numeric_input(value, input_type, context.user_id,
+                                                _skip_rate_limit=True)
+
                 if isinstance(value, str):
                     sanitized = self.sanitize_string_input(value)
                     if sanitized != value:
@@ -400,10 +466,10 @@ class InputValidator:
 
     def get_validation_summary(self) -> Dict[str, Any]:
         """Get validation statistics and current status"""
-        now = datetime.now()
+        now = time.monotonic()
 
         active_blocks = {
-            client_id: (block_time - now).total_seconds()
+            client_id: block_time - now
             for client_id, block_time in self.blocked_clients.items()
             if block_time > now
         }
@@ -411,7 +477,7 @@ class InputValidator:
         return {
             'validation_rules_count': len(self.validation_rules),
             'rate_limit_rules_count': len(self.rate_limits),
-            'active_clients': len(self.request_history),
+            'active_clients': len({client_id for client_id, _ in self.buckets}),
             'blocked_clients': len(active_blocks),
             'blocked_client_details': active_blocks
         }
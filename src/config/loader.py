@@ -42,9 +42,11 @@ class InvalidConfigurationError(Exception):
 class FileSettingsSource(PydanticBaseSettingsSource):
     """Custom settings source for loading from YAML or JSON files."""
 
-    def __init__(self, settings_cls: Type[BaseSettings], file_path: Path | None = None):
+    def __init__(self, settings_cls: Type[BaseSettings], file_path: Path | None = None,
+                 data: Dict[str, Any] | None = None):
         super().__init__(settings_cls)
         self.file_path = file_path
+        self.data = data
 
     def _read_file(self, file_path: Path) -> Dict[str, Any]:
         """Read configuration from YAML or JSON file."""
@@ -68,6 +70,8 @@ class FileSettingsSource(PydanticBaseSettingsSource):
 
     def __call__(self) -> Dict[str, Any]:
         """Return mapping of settings from file source."""
+        if self.data is not None:
+            return self.data
         if self.file_path:
             return self._read_file(self.file_path)
         return {}
@@ -114,7 +118,8 @@ class ConfigSchema(BaseSettings):
         Precedence (highest to lowest): ENV > .env > FILE > defaults
         """
         file_path = getattr(settings_cls, "_file_path", None)
-        file_source = FileSettingsSource(settings_cls, file_path)
+        file_data = getattr(settings_cls, "_file_data", None)
+        file_source = FileSettingsSource(settings_cls, file_path, file_data)
         return (env_settings, dotenv_settings, file_source, init_settings)
 
 # ------------------------------------------------------------------------------
@@ -124,6 +129,7 @@ def load_config(
     path: str | Path = "config.yaml",
     *,
     allow_unknown: bool = False,
+    data: Dict[str, Any] | None = None,
 ) -> ConfigSchema:
     """
     Load, parse, and validate configuration with precedence:
@@ -138,6 +144,9 @@ def load_config(
         Path to YAML or JSON configuration file (optional).
     allow_unknown : bool
         If True, unknown keys in controller configs will be accepted and collected.
+    data : dict | None
+        Already-parsed contents of the file at `path`. When given, the file is
+        not read again; it keeps the FILE precedence level.
 
     Raises
     ------
@@ -156,8 +165,9 @@ def load_config(
             load_dotenv(".env", override=False)
             logger.debug("Loaded .env file")
 
-        # Attach file path so settings_customise_sources can see it
+        # Attach file path/data so settings_customise_sources can see them
         ConfigSchema._file_path = file_path  # type: ignore[attr-defined]
+        ConfigSchema._file_data = data  # type: ignore[attr-defined]
 
         try:
             cfg = ConfigSchema()
@@ -215,4 +225,6 @@ def load_config(
         PermissiveControllerConfig.allow_unknown = previous_allow
         # cleanup temp attribute
         if hasattr(ConfigSchema, "_file_path"):
-            delattr(ConfigSchema, "_file_path")
\ No newline at end of file
+            delattr(ConfigSchema, "_file_path")
+        if hasattr(ConfigSchema, "_file_data"):
+            delattr(ConfigSchema, "_file_data")
\ No newline at end of file
@@ -147,10 +147,9 @@ class ThreadSafeMetric:
                            window_seconds: Optional[float] = None,
                            percentile: float = 95.0) -> Optional[float]:
         """Get aggregated value over specified window with thread safety."""
+        # Only the snapshot needs the lock; aggregating it outside keeps
+        # concurrent readers (and writers) from queueing behind the math
         with self._lock:
-            if not self.values:
-                return None
-
             # Filter values by time window if specified
             if window_seconds:
                 cutoff_time = time.time() - window_seconds
@@ -158,34 +157,34 @@ class ThreadSafeMetric:
             else:
                 recent_values = [v.value for v in self.values]
 
-            if not recent_values:
-                return None
-
-            # Calculate aggregation
-            if aggregation == AggregationType.SUM:
-                return sum(recent_values)
-            elif aggregation == AggregationType.AVERAGE:
-                return sum(recent_values) / len(recent_values)
-            elif aggregation == AggregationType.MIN:
-                return min(recent_values)
-            elif aggregation == AggregationType.MAX:
-                return max(recent_values)
-            elif aggregation == AggregationType.COUNT:
-                return len(recent_values)
-            elif aggregation == AggregationType.PERCENTILE:
-                sorted_values = sorted(recent_values)
-                index = int((percentile / 100.0) * len(sorted_values))
-                index = min(index, len(sorted_values) - 1)
-                return sorted_values[index]
-            elif aggregation == AggregationType.RATE:
-                if len(recent_values) < 2:
-                    return 0.0
-                # Calculate rate per second
-                time_span = window_seconds or self.retention_window
-                return len(recent_values) / time_span
-
+        if not recent_values:
             return None
 
+        # Calculate aggregation
+        if aggregation == AggregationType.SUM:
+            return sum(recent_values)
+        elif aggregation == AggregationType.AVERAGE:
+            return sum(recent_values) / len(recent_values)
+        elif aggregation == AggregationType.MIN:
+            return min(recent_values)
+        elif aggregation == AggregationType.MAX:
+            return max(recent_values)
+        elif aggregation == AggregationType.COUNT:
+            return len(recent_values)
+        elif aggregation == AggregationType.PERCENTILE:
+            sorted_values = sorted(recent_values)
+            index = int((percentile / 100.0) * len(sorted_values))
+            index = min(index, len(sorted_values) - 1)
+            return sorted_values[index]
+        elif aggregation == AggregationType.RATE:
+            if len(recent_values) < 2:
+                return 0.0
+            # Calculate rate per second
+            time_span = window_seconds or self.retention_window
+            return len(recent_values) / time_span
+
+        return None
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get metric statistics safely."""
         with self._lock:
@@ -337,19 +336,19 @@ class ThreadSafeMetricsCollector:
     def get_metric_value(self, metric_name: str, aggregation: AggregationType = AggregationType.AVERAGE,
                         window_seconds: Optional[float] = None) -> Optional[float]:
         """Get metric value safely."""
-        with self._metrics_lock:
-            if metric_name not in self._metrics:
-                return None
-            metric = self._metrics[metric_name]
+        # Lock-free read: the registry is only mutated under _metrics_lock and
+        # a single dict lookup is atomic, so readers never serialize here
+        metric = self._metrics.get(metric_name)
+        if metric is None:
+            return None
 
         return metric.get_aggregated_value(aggregation, window_seconds)
 
     def get_metric_statistics(self, metric_name: str) -> Optional[Dict[str, Any]]:
         """Get metric statistics safely."""
-        with self._metrics_lock:
-            if metric_name not in self._metrics:
-                return None
-            metric = self._metrics[metric_name]
+        metric = self._metrics.get(metric_name)  # Lock-free read, see get_metric_value
+        if metric is None:
+            return None
 
         return metric.get_statistics()
 
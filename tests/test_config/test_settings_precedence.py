@@ -52,3 +52,19 @@ def test_file_used_when_no_env_or_dotenv(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.delenv("C04__SIMULATION__DT", raising=False)
     cfg = load_config(str(cfg_path))
     assert float(cfg.simulation.dt) > 0.0
+
+
+def test_preparsed_data_used_instead_of_file(monkeypatch: pytest.MonkeyPatch):
+    """Pre-parsed file data should be used at FILE precedence without re-reading the file."""
+    import yaml
+
+    repo_root = _repo_root_from_here()
+    cfg_path = repo_root / "config.yaml"
+    assert cfg_path.exists()
+
+    data = yaml.safe_load(cfg_path.read_text(encoding="utf-8"))
+    data["simulation"]["dt"] = 0.0123
+
+    monkeypatch.delenv("C04__SIMULATION__DT", raising=False)
+    cfg = load_config(str(cfg_path), data=data)
+    assert float(cfg.simulation.dt) == pytest.approx(0.0123, rel=0, abs=1e-12)